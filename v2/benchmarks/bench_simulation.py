@@ -0,0 +1,240 @@
+# benchmarks/bench_simulation.py
+#
+# Benchmarks for the simulation hot paths. For every (grid size,
+# drone count) pair of the matrix it times:
+# - model construction
+# - full PalmerasModel.step
+# - stages: DroneAgent.do_sensing / do_control / do_output_communication,
+#   palm updates (PalmAgent.step or WorldState.step_palms), data
+#   collection (DataCollector.collect + AgentRecorder.collect) and the
+#   batched CV inference (InferenceQueue.run, with --batch-inference)
+#
+# Results are written as JSON so two commits can be compared:
+#   python benchmarks/bench_simulation.py --quick --output before.json
+#   python benchmarks/bench_simulation.py --quick --output after.json
+#   python benchmarks/bench_simulation.py --compare before.json after.json
+#
+# Batched CV inference against a backend with a fixed per-call latency:
+#   python benchmarks/bench_simulation.py --quick --cv-latency 0.002
+#   python benchmarks/bench_simulation.py --quick --cv-latency 0.002 --batch-inference
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+import contextlib
+from datetime import datetime
+from statistics import mean, median
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+from mesa.datacollection import DataCollector
+
+from src.models.model import PalmerasModel
+from src.models.WorldState import WorldState
+from src.models.AgentRecorder import AgentRecorder
+from src.models.InferenceQueue import InferenceQueue
+from src.models.RadioNetwork import RadioNetwork
+from src.agents.DroneAgent import DroneAgent
+from src.agents.PalmAgent import PalmAgent
+from src.agents.components.CVBackends import DummyCVBackend
+
+# --- Benchmark matrix --- #
+GRID_SIZES = [12, 50, 100, 200, 500]
+DRONE_COUNTS = [1, 10, 50, 200, 500]
+QUICK_GRID_SIZES = [12, 50]
+QUICK_DRONE_COUNTS = [1, 10]
+
+# Stage name -> list of (class, method name) timed together
+STAGES = {
+    "drone_sensing": [(DroneAgent, "do_sensing")],
+    "drone_control": [(DroneAgent, "do_control")],
+    "drone_output_communication": [(DroneAgent, "do_output_communication")],
+    "cv_inference": [(InferenceQueue, "run")],    # batch_inference only
+    "radio_delivery": [(RadioNetwork, "broadcast")],    # radio_range only
+    "palm_update": [(PalmAgent, "step"), (WorldState, "step_palms")],
+    "data_collection": [(DataCollector, "collect"), (AgentRecorder, "collect")],
+}
+
+
+class StageTimer:
+    """Wraps class methods while active and accumulates their run time per stage."""
+
+    def __init__(self, stages):
+        self.stages = stages
+        self.totals = {name: 0.0 for name in stages}
+        self._originals = []
+
+    def _wrap(self, stage, method):
+        totals = self.totals
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                totals[stage] += time.perf_counter() - start
+        return timed
+
+    def reset(self):
+        for name in self.totals:
+            self.totals[name] = 0.0
+
+    def __enter__(self):
+        for stage, targets in self.stages.items():
+            for cls, name in targets:
+                original = cls.__dict__[name]
+                self._originals.append((cls, name, original))
+                setattr(cls, name, self._wrap(stage, original))
+        return self
+
+    def __exit__(self, *exc):
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+
+
+def benchmark_case(width, n_drones, steps, warmup, seed, engine, cv_latency=None, batch_inference=False,
+                   radio_range=None):
+    """Time construction, steps and stages for one configuration."""
+    params = dict(width=width, height=width, densidad=0.2, n_drones=n_drones,
+                  tasa_propagacion=0.1, tasa_cura=0.8, engine=engine, seed=seed,
+                  batch_inference=batch_inference, radio_range=radio_range)
+    if cv_latency is not None:
+        params["cv_backend"] = DummyCVBackend(np.random.default_rng(seed), latency=cv_latency)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        model = PalmerasModel(**params)
+        construction = time.perf_counter() - start
+
+        for _ in range(warmup):
+            model.step()
+
+        step_times = []
+        with StageTimer(STAGES) as stage_timer:
+            stage_timer.reset()
+            for _ in range(steps):
+                start = time.perf_counter()
+                model.step()
+                step_times.append(time.perf_counter() - start)
+            stage_totals = dict(stage_timer.totals)
+
+    return {
+        "engine": engine,
+        "width": width,
+        "height": width,
+        "n_drones": n_drones,
+        "steps": steps,
+        "seed": seed,
+        "cv_latency": cv_latency,
+        "batch_inference": batch_inference,
+        "radio_range": radio_range,
+        "construction_s": construction,
+        "step_mean_s": mean(step_times),
+        "step_median_s": median(step_times),
+        "step_min_s": min(step_times),
+        "stages_per_step_s": {name: total / steps for name, total in stage_totals.items()},
+    }
+
+
+def max_drones(width):
+    """Drones need one free border cell each for their charging station."""
+    return 4 * (width - 1)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_matrix(grid_sizes, drone_counts, steps, warmup, seed, engine, cv_latency=None, batch_inference=False,
+               radio_range=None):
+    results = []
+    for width in grid_sizes:
+        for n_drones in drone_counts:
+            if n_drones > max_drones(width):
+                print(f"[SKIP] {width}x{width} has no room for {n_drones} stations")
+                continue
+            case = benchmark_case(width, n_drones, steps, warmup, seed, engine, cv_latency, batch_inference,
+                                  radio_range)
+            results.append(case)
+            print(f"[{engine}] {width:>4}x{width:<4} drones={n_drones:<4} "
+                  f"init={case['construction_s']:.3f}s step={case['step_median_s'] * 1000:.2f}ms")
+    return results
+
+
+def compare(before_path, after_path):
+    """Print the step and stage time ratio (after / before) for matching cases."""
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    key = lambda c: (c["engine"], c["width"], c["n_drones"])
+    before_cases = {key(c): c for c in before["results"]}
+
+    print(f"{before.get('commit')} -> {after.get('commit')} (ratio < 1 is faster)")
+    for case in after["results"]:
+        old = before_cases.get(key(case))
+        if old is None:
+            continue
+        ratios = {"init": case["construction_s"] / old["construction_s"],
+                  "step": case["step_median_s"] / old["step_median_s"]}
+        for stage, value in case["stages_per_step_s"].items():
+            old_value = old["stages_per_step_s"].get(stage, 0.0)
+            if old_value > 0:
+                ratios[stage] = value / old_value
+        text = " ".join(f"{name}={ratio:.2f}" for name, ratio in ratios.items())
+        print(f"[{case['engine']}] {case['width']}x{case['height']} drones={case['n_drones']}: {text}")
+
+
+parser = argparse.ArgumentParser(description="Benchmark PalmerasModel hot paths")
+parser.add_argument("--grid", type=int, nargs="+", help="grid sizes (square)")
+parser.add_argument("--drones", type=int, nargs="+", help="drone counts")
+parser.add_argument("--quick", action="store_true", help="small matrix for a fast check")
+parser.add_argument("--engine", default="agents", choices=["agents", "arrays"])
+parser.add_argument("--steps", type=int, default=20, help="timed steps per case")
+parser.add_argument("--warmup", type=int, default=5, help="untimed steps per case")
+parser.add_argument("--seed", type=int, default=42)
+parser.add_argument("--cv-latency", type=float, default=None,
+                    help="use a dummy CV backend with this latency per call (seconds)")
+parser.add_argument("--batch-inference", action="store_true", help="one batched CV inference per tick")
+parser.add_argument("--radio-range", type=int, default=None,
+                    help="range-limited radio with this range in cells (default: global blackboard)")
+parser.add_argument("--output", default="benchmarks/results.json")
+parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two result files")
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        sys.exit(0)
+
+    grid_sizes = args.grid or (QUICK_GRID_SIZES if args.quick else GRID_SIZES)
+    drone_counts = args.drones or (QUICK_DRONE_COUNTS if args.quick else DRONE_COUNTS)
+
+    results = run_matrix(grid_sizes, drone_counts, args.steps, args.warmup, args.seed, args.engine,
+                         args.cv_latency, args.batch_inference, args.radio_range)
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Benchmark results saved to {args.output}")
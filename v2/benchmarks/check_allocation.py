@@ -0,0 +1,88 @@
+# benchmarks/check_allocation.py
+#
+# Checks and times the fleet target allocation (TargetAllocator):
+# - optimality: on small random cases, the auction total distance
+#   must match a brute force over every one-to-one matching (both
+#   more targets than drones, pruned or not, and the reverse)
+# - timing: greedy vs auction per allocation on large cases
+#
+#   python benchmarks/check_allocation.py
+#   python benchmarks/check_allocation.py --cases 5000 --seed 1
+
+import os
+import sys
+import time
+import random
+import argparse
+import itertools
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.models.TargetAllocator import TargetAllocator, distance_matrix
+
+# (drones, targets) timed on a TIMING_GRID x TIMING_GRID grid
+TIMING_CASES = [(10, 500), (50, 2000), (200, 2000)]
+TIMING_GRID = 500
+
+
+def random_case(rng, n_drones, n_targets, width):
+    drones = {i: (rng.randrange(width), rng.randrange(width)) for i in range(n_drones)}
+    targets = list({(rng.randrange(width), rng.randrange(width)) for _ in range(n_targets)})
+    return drones, targets
+
+
+def total_distance(drones, assignments):
+    return sum(abs(drones[i][0] - t[0]) + abs(drones[i][1] - t[1]) for i, t in assignments.items())
+
+
+def brute_force(drones, targets):
+    """Minimum total distance over every one-to-one matching."""
+    cost = distance_matrix([drones[i] for i in range(len(drones))], targets)
+    n_rows, n_cols = cost.shape
+    if n_rows <= n_cols:
+        return min(sum(cost[r, perm[r]] for r in range(n_rows))
+                   for perm in itertools.permutations(range(n_cols), n_rows))
+    return min(sum(cost[perm[c], c] for c in range(n_cols))
+               for perm in itertools.permutations(range(n_rows), n_cols))
+
+
+def check_optimality(cases, seed):
+    rng = random.Random(seed)
+    allocator = TargetAllocator("auction")
+    for case in range(cases):
+        # Up to 14 targets for 1-3 drones also covers the candidate pruning
+        n_drones = rng.randint(1, 5)
+        n_targets = rng.randint(1, 7) if n_drones > 3 else rng.randint(1, 14)
+        drones, targets = random_case(rng, n_drones, n_targets, rng.choice([3, 10, 60]))
+
+        assignments = allocator.allocate(drones, targets)
+        expected = min(len(drones), len(targets))
+        if len(assignments) != expected or len(set(assignments.values())) != expected:
+            raise AssertionError(f"case {case}: not a one-to-one matching {assignments}")
+
+        got, best = total_distance(drones, assignments), brute_force(drones, targets)
+        if got != best:
+            raise AssertionError(f"case {case}: auction {got} != optimum {best} for {drones} {targets}")
+    print(f"✅ auction optimal on {cases} random cases")
+
+
+def time_methods(seed):
+    rng = random.Random(seed)
+    for n_drones, n_targets in TIMING_CASES:
+        drones, targets = random_case(rng, n_drones, n_targets, TIMING_GRID)
+        line = f"drones={n_drones:<4} targets={n_targets:<5}"
+        for method in ("greedy", "auction"):
+            start = time.perf_counter()
+            TargetAllocator(method).allocate(drones, targets)
+            line += f" {method}={time.perf_counter() - start:.3f}s"
+        print(line)
+
+
+parser = argparse.ArgumentParser(description="Check and time TargetAllocator")
+parser.add_argument("--cases", type=int, default=2000, help="random brute-force cases")
+parser.add_argument("--seed", type=int, default=0)
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    check_optimality(args.cases, args.seed)
+    time_methods(args.seed)
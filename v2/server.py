@@ -30,6 +30,9 @@ from src.agents.DroneAgent import DroneAgent
 # Models
 from src.models.model import PalmerasModel
 
+# Results
+from src.utils.ResultWriter import export_csv
+
 
 # ---------------------------------------------------------------- #
 
@@ -37,6 +40,8 @@ from src.models.model import PalmerasModel
 from src.visualization.AgentPortrayal import AgentPortrayal
 from src.visualization.BlackboardText import BlackboardText
 
+RESULTS_DIR = "results/server_run"
+
 grid = CanvasGrid(AgentPortrayal, 12, 12, 600, 600)
 blackboard_text = BlackboardText()
 
@@ -51,6 +56,8 @@ model_params = {
 
     "tasa_propagacion": Slider("Tasa de propagación", 0.01, 0.0, 1.0, 0.05),
     "tasa_cura": Slider("Tasa de curación por drones", 1.0, 0.0, 1.0, 0.05),
+
+    "results_dir": RESULTS_DIR,
 }
 
 server = ModularServer(
@@ -63,11 +70,8 @@ server = ModularServer(
 def save_data():
     try:
         if hasattr(server, "model") and server.model is not None:
-            model_df = server.model.datacollector.get_model_vars_dataframe()
-            agents_df = server.model.datacollector.get_agent_vars_dataframe()
-
-            model_df.to_csv("resultados_modelo.csv", index=True)
-            agents_df.to_csv("resultados_agentes.csv", index=True)
+            server.model.close_results()
+            export_csv(RESULTS_DIR, "resultados_modelo.csv", "resultados_agentes.csv")
 
             print("✅ Datos guardados en 'resultados_modelo.csv' y 'resultados_agentes.csv'")
         else:
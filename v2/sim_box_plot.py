@@ -5,16 +5,20 @@ from pathlib import Path
 
 # 📁 Configuración de carpeta
 DATA_DIR = Path("results_per_drone")
+SWEEP_FILE = DATA_DIR / "sweep_results.csv"   # generado por sim_sweep.py
 
-# 📥 Leer y combinar los 20 archivos
+# 📥 Leer la tabla del barrido, o combinar los 20 archivos por dron
 dfs = []
-for i in range(1, 21):
-    file_path = DATA_DIR / f"drones_{i}.csv"
-    if file_path.exists():
-        df = pd.read_csv(file_path)
-        dfs.append(df)
-    else:
-        print(f"[WARNING] Archivo no encontrado: {file_path}")
+if SWEEP_FILE.exists():
+    dfs.append(pd.read_csv(SWEEP_FILE))
+else:
+    for i in range(1, 21):
+        file_path = DATA_DIR / f"drones_{i}.csv"
+        if file_path.exists():
+            df = pd.read_csv(file_path)
+            dfs.append(df)
+        else:
+            print(f"[WARNING] Archivo no encontrado: {file_path}")
 
 # 🧪 Unir DataFrames
 if not dfs:
@@ -1,32 +1,6 @@
 import os
-import json
 import pandas as pd
-from datetime import datetime
-from src.models.model import PalmerasModel
-
-def run_simulation(params: dict):
-    model = PalmerasModel(
-        width=params["width"],
-        height=params["height"],
-        densidad=params["densidad"],
-        n_drones=params["n_drones"],
-        tasa_propagacion=params["tasa_propagacion"],
-        tasa_cura=params["tasa_cura"]
-    )
-    for _ in range(params["max_steps"]):
-        model.step()
-    return model.datacollector.get_model_vars_dataframe()
-
-def safe_div(n, d):
-    return n / d if d > 0 else 0
-
-def compute_score(row):
-    palmas_totales = row["PalmasTotales"]
-    infectadas = row["PalmasInfectadas"]
-    cured_rate = safe_div(row["PalmasSanas"], palmas_totales)
-    burned_rate = safe_div(row["PalmasQuemadas"], palmas_totales)
-    detection_rate = safe_div(row["PalmasDetectadas"], infectadas)
-    return 0.4 * cured_rate + 0.3 * (1 - burned_rate) + 0.3 * detection_rate
+from src.utils.simulation_runner import run_simulation, compute_score
 
 # --------------------------
 # Configuración
@@ -0,0 +1,60 @@
+# sim_sweep.py
+#
+# Parallel parameter sweep: every combination of the grid below is run
+# `--runs` times with its own seed on a process pool, and the per-run
+# final scores are merged into one results table.
+#
+# Example (full 1–20 drone study on every core):
+#   python sim_sweep.py --drones 1-20 --runs 10
+
+import os
+import argparse
+from src.utils.simulation_runner import run_sweep
+
+
+def parse_values(text, cast):
+    """Parse "1-20", "0.1,0.2" or "5" into a list of values."""
+    if "-" in text and cast is int:
+        start, end = text.split("-")
+        return list(range(int(start), int(end) + 1))
+    return [cast(v) for v in text.split(",")]
+
+
+parser = argparse.ArgumentParser(description="Parallel parameter sweep for PalmerasModel")
+parser.add_argument("--drones", default="1-20", help='drone counts, e.g. "1-20" or "1,5,10"')
+parser.add_argument("--densidad", default="0.2")
+parser.add_argument("--tasa-propagacion", default="0.1")
+parser.add_argument("--grid", default="12", help='grid sizes (square), e.g. "12,24"')
+parser.add_argument("--tasa-cura", type=float, default=0.8)
+parser.add_argument("--steps", type=int, default=100)
+parser.add_argument("--runs", type=int, default=10, help="replications per combination")
+parser.add_argument("--seed", type=int, default=0, help="root seed for the per-run seeds")
+parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+parser.add_argument("--engine", default="agents", choices=["agents", "arrays"])
+parser.add_argument("--allocation", default=None, choices=["greedy", "auction"],
+                    help="fleet-wide target allocation (default: each drone picks its closest target)")
+parser.add_argument("--output", default="results_per_drone/sweep_results.csv")
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    base_params = {
+        "tasa_cura": args.tasa_cura,
+        "max_steps": args.steps,
+        "engine": args.engine,
+        "target_allocation": args.allocation,
+    }
+    sizes = parse_values(args.grid, int)
+    grid = {
+        "n_drones": parse_values(args.drones, int),
+        "densidad": parse_values(args.densidad, float),
+        "tasa_propagacion": parse_values(args.tasa_propagacion, float),
+        "width": sizes,     # square grids, height defaults to width
+    }
+
+    print(f"🚀 Sweep: {grid} x {args.runs} runs")
+    results = run_sweep(base_params, grid, args.runs, seed=args.seed, max_workers=args.workers)
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    results.to_csv(args.output, index=False)
+    print(f"✅ Resultados guardados en {args.output}")
@@ -12,6 +12,7 @@ sys.path.append(os.path.abspath("src"))
 # MESA imports
 from mesa.batchrunner import BatchRunner
 from src.models.model import PalmerasModel
+from src.utils.ResultWriter import export_csv
 
 # --- Parameters (can be modified manually or passed via CLI in the future) --- #
 params = {
@@ -21,33 +22,39 @@ params = {
     "n_drones": 3,
     "tasa_propagacion": 0.1,
     "tasa_cura": 0.8,
-    "max_steps": 1000
+    "max_steps": 1000,
+    "chunk_size": 1000
 }
 
-# --- Initialize and Run Simulation --- #
+# --- Results Folder with Timestamp --- #
+timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+output_dir = f"results/simulation_{timestamp}"
+chunks_dir = os.path.join(output_dir, "chunks")
+os.makedirs(output_dir, exist_ok=True)
+
+# --- Initialize and Run Simulation (data is streamed to chunks_dir) --- #
 model = PalmerasModel(
     width=params["width"],
     height=params["height"],
     densidad=params["densidad"],
     n_drones=params["n_drones"],
     tasa_propagacion=params["tasa_propagacion"],
-    tasa_cura=params["tasa_cura"]
+    tasa_cura=params["tasa_cura"],
+    results_dir=chunks_dir,
+    chunk_size=params["chunk_size"]
 )
 
 for step in range(params["max_steps"]):
     model.step()
 
-# --- Collect Data --- #
-model_df = model.datacollector.get_model_vars_dataframe()
-agents_df = model.datacollector.get_agent_vars_dataframe()
+model.close_results()
 
-# --- Save Results with Timestamp --- #
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-output_dir = f"results/simulation_{timestamp}"
-os.makedirs(output_dir, exist_ok=True)
-
-model_df.to_csv(os.path.join(output_dir, "model_data.csv"))
-agents_df.to_csv(os.path.join(output_dir, "agents_data.csv"))
+# --- Save Results as CSV (converted chunk by chunk) --- #
+export_csv(
+    chunks_dir,
+    os.path.join(output_dir, "model_data.csv"),
+    os.path.join(output_dir, "agents_data.csv")
+)
 
 # --- Save Params Used --- #
 with open(os.path.join(output_dir, "params.json"), "w") as f:
@@ -22,6 +22,15 @@ FSM_TRANSITIONS = {
 
 
 class DroneAgent(Agent):
+    # Step phases, in execution order
+    PHASES = (
+        "do_input_communication",
+        "do_sensing",
+        "do_control",
+        "do_action",
+        "do_output_communication",
+    )
+
     def __init__(self, unique_id, model, pos):
         super().__init__(unique_id, model)
 
@@ -34,7 +43,8 @@ class DroneAgent(Agent):
         self.state = "exploring"
         self.target = None
 
-        self.is_charging = False
+        self._is_charging = False
+        self.pending_recharges = 0  # Event activation: recharges slept through
         self.on_mission = False
         self.is_curing = False
 
@@ -42,14 +52,14 @@ class DroneAgent(Agent):
         self.known_drones = []
         self.known_charging_stations = []
 
-        self.detected_palms_in_photo = {} # (x,y): confianza, (1,0): 0.9
+        self.detected_palms_in_photo = None # (xs, ys, signed confidences) arrays
 
         self.radio = Radio(model, unique_id)
         self.rotors = Rotors(model)
         self.gps = GPS(*pos, model)
         self.camera = Camera(model)
         self.cv_model = CVModel(model)
-        self.controller = Controller()
+        self.controller = Controller(model.navigation)
         self.battery = Battery(model, unique_id, 100)
         self.medicine = MedicineDispenser(model, unique_id, 100)
 
@@ -58,6 +68,19 @@ class DroneAgent(Agent):
         self.battery_level = 100
         self.medicine_level = 100
 
+        model.counters.drone_added()
+
+    @property
+    def is_charging(self):
+        return self._is_charging
+
+    @is_charging.setter
+    def is_charging(self, value):
+        # Keep the model population counters in sync on transitions
+        if value != self._is_charging:
+            self.model.counters.drone_charging_changed(value)
+        self._is_charging = value
+
     def step(self):
         #print(f"[Drone {self.unique_id}] Step - Position: {self.pos}, State: {self.state}")
         self.do_input_communication()
@@ -70,29 +93,62 @@ class DroneAgent(Agent):
         x, y = pos
         return 0 <= x < self.model.grid.width and 0 <= y < self.model.grid.height
 
+    def can_take_target(self):
+        """
+        True if do_control would send this drone after a target: not while
+        it charges, flies to a station or dispenses medicine.
+        """
+        if self.state in ("charging", "going_to_charging_station", "curing"):
+            return False
+        return self.battery.get_level() > 20 and self.medicine.get_level() > 20
+
     def do_input_communication(self):
-        self.known_targets = self.radio.read_blackboard_palms_targets()
-        self.known_drones = self.radio.read_blackboard_drones_positions()
+        if self.radio.network is not None:
+            # Range-limited radio: targets and drones heard from the drones
+            # in range; the charging stations are fixed and known to all
+            self.radio.receive()
+            self.known_targets = self.radio.targets
+            self.known_drones = self.radio.neighbors
+            self.known_charging_stations = self.radio.read_blackboard_charging_stations_positions()
+            return
+
+        # Spatial index over the blackboard targets (nearest queries), or
+        # only the target assigned to this drone by the fleet allocator
+        assignments = self.radio.read_blackboard_targets_assignments()
+        if assignments is None:
+            self.known_targets = self.radio.read_blackboard_targets_index()
+        else:
+            target = assignments.get(self.unique_id)
+            self.known_targets = [] if target is None else [{"location": target}]
+        # Cells with drones, O(1) `pos in known_drones` collision checks
+        self.known_drones = self.radio.read_drones_occupancy()
         self.known_charging_stations = self.radio.read_blackboard_charging_stations_positions()
 
     def do_output_communication(self):
-        self.radio.publish_blackboard_drones_position(self.gps.get_position())
-        if self.detected_palms_in_photo:
-            for pos, confidence in self.detected_palms_in_photo.items():
-                if(confidence > 0):
-                    self.radio.publish_blackboard_palms_target(pos, confidence)
-                if(confidence < 0):
-                    self.radio.report_palm_cured(pos, confidence)
+        position = self.gps.get_position()
+        self.radio.publish_blackboard_drones_position(position)
+        if self.detected_palms_in_photo is not None:
+            self.radio.publish_blackboard_detections(*self.detected_palms_in_photo)
+        if self.radio.network is not None:
+            self.radio.broadcast(position, self.detected_palms_in_photo)
 
-        self.detected_palms_in_photo = {}
+        self.detected_palms_in_photo = None
 
     def do_sensing(self):
+        self.capture()
+        self.receive_vision(self.cv_model.analyze(self.photo, self.pos))
+
+    def capture(self):
+        """First half of do_sensing: photo and sensor levels, no inference."""
         self.photo = self.camera.take_photo(self.pos)
-        self.vision = self.cv_model.analyze(self.photo)
         self.battery_level = self.battery.get_level()
         self.medicine_level = self.medicine.get_level()
+
+    def receive_vision(self, vision):
+        """Second half of do_sensing: CV result of the last photo."""
+        self.vision = vision
         x0 , y0 = self.pos
-        self.detected_palms_in_photo = self.cv_model.convert_infected_matrix_to_dict(self.vision, x0, y0)
+        self.detected_palms_in_photo = self.cv_model.detections(self.vision, x0, y0)
 
     def _set_exploration_path(self, position):
         self.state = "exploring"
@@ -112,13 +168,14 @@ class DroneAgent(Agent):
         battery_ok = self.battery.get_level() > 20
         medicine_ok = self.medicine.get_level() > 20
 
-        # Get nearest charging station
-        closest_station, _ = self.controller.get_closest_charging_station(position, stations)
+        # Get nearest charging station (precomputed per cell by the model)
+        closest_station, _ = self.radio.read_nearest_charging_station(position)
         station_pos = closest_station
 
         # --- STATE CONTROL LOGIC ---
         if self.state == "charging":
             self.is_charging = True
+            self._apply_pending_recharges()
             if self.battery.get_level() > 90 and self.medicine.get_level() > 90:
                 self.state = "exploring"
                 self.is_charging = False
@@ -137,7 +194,7 @@ class DroneAgent(Agent):
             return
 
         # Cure if standing on infected palm
-        confidence = self.detected_palms_in_photo.get(position, 0)
+        confidence = self.cv_model.center_confidence(self.vision)
         if confidence > 0.5:
             self.state = "curing"
             self.next_move = position
@@ -168,11 +225,35 @@ class DroneAgent(Agent):
         elif self.state == "charging":
             self.battery.recharge()
             self.medicine.refill()
-            pass
+            self._sleep_until_charged()
 
         else:
             print(f"[WARNING] Drone {self.unique_id} attempted invalid move in state {self.state}")
 
+    def _sleep_until_charged(self):
+        """
+        Event activation: the next ticks of a charge only recharge, so
+        sleep until the tick do_control lets the drone go and apply the
+        recharges in bulk then. Drones on the range-limited radio keep
+        stepping, a silent drone would vanish from its neighbours' view.
+        """
+        if not self.model.event_activation or self.radio.network is not None:
+            return
+        if self.medicine.get_level() <= 90:
+            return
+
+        recharges = self.battery.recharges_until_above(90)
+        if recharges:
+            self.pending_recharges = recharges
+            schedule = self.model.schedule
+            schedule.sleep(self, until=schedule.time + recharges + 1)
+
+    def _apply_pending_recharges(self):
+        for _ in range(self.pending_recharges):
+            self.battery.recharge()
+            self.medicine.refill()
+        self.pending_recharges = 0
+
     def _perform_curing(self, position):
         avg_health = self.medicine.get_sensor_palm_health(position)
 
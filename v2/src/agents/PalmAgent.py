@@ -1,6 +1,7 @@
 # --------------------------------------------------------- #
 # --- Imports --------------------------------------------- #
 # --------------------------------------------------------- #
+import math
 import random
 from mesa import Agent
 # --------------------------------------------------------- #
@@ -36,6 +37,13 @@ class PalmAgent(Agent):
     It interacts with its neighbors to potentially get infected and
     degrades health over time if infected. If health drops to zero, it dies.
     It can also become auto-infected based on probability.
+
+    The state and health are stored in the model WorldState arrays;
+    `estado` and `health_level` are views over the agent cell.
+
+    With event activation, a healthy palm with no infected neighbour
+    sleeps until a neighbour gets infected or until the tick of its
+    next auto-infection, drawn in advance.
     """
 
     # Constants
@@ -49,12 +57,38 @@ class PalmAgent(Agent):
 
         # State
         self.pos = pos                     # Tuple (x, y)
-        self.estado = estado              # 'verde', 'infectada', 'muerta'
-        self.health_level = 100           # Range: 0–100
+        self.model.world.place_palm(pos, estado)  # 'verde', 'infectada', 'muerta'
+        self.auto_infection_tick = None    # Event activation: drawn auto-infection tick
+
+    @property
+    def estado(self):
+        return self.model.world.get_palm_state(self.pos)
+
+    @estado.setter
+    def estado(self, value):
+        self.model.world.set_palm_state(self.pos, value)
+        if value == "infectada" and self.model.event_activation:
+            self._wake_neighbors()
+
+    @property
+    def is_terminal(self):
+        """Dead palms never change again and can leave the active schedule."""
+        return self.estado == "muerta"
+
+    @property
+    def health_level(self):
+        return float(self.model.world.palm_health[self.pos])   # Range: 0–100
+
+    @health_level.setter
+    def health_level(self, value):
+        self.model.world.set_palm_health(self.pos, value)
 
     def step(self):
         """Update palm health and infection state."""
         if self.estado == "verde":
+            if self.model.event_activation and self._sleep_if_quiescent():
+                return
+
             infected_by_neighbors = self._try_infection()
 
             if not infected_by_neighbors:
@@ -77,8 +111,50 @@ class PalmAgent(Agent):
     def _maybe_auto_infect(self):
         """Apply a small chance of random infection even without infected neighbors."""
         if random.random() < self.AUTO_INFECTED_PROBABILITY:
-            self.estado = "infectada"
-            print(f"[AUTO-INFECTED] Palm at {self.pos} became infected randomly.")
+            self._auto_infect()
+
+    def _auto_infect(self):
+        self.estado = "infectada"
+        print(f"[AUTO-INFECTED] Palm at {self.pos} became infected randomly.")
+
+    def _sleep_if_quiescent(self):
+        """
+        Event activation: a healthy palm with no infected neighbour can
+        only auto-infect, so draw the tick of that infection (geometric,
+        same odds as one _maybe_auto_infect per tick) and sleep until then.
+        Returns True if the palm slept or auto-infected, False if it has
+        to step normally.
+        """
+        schedule = self.model.schedule
+        due = self.auto_infection_tick == schedule.time
+        self.auto_infection_tick = None
+        if due:
+            self._auto_infect()
+            return True
+
+        if self.model.world.has_infected_neighbor(self.pos):
+            return False
+
+        # Ticks until the first success, this one included
+        delay = 1 + int(math.log(1.0 - random.random()) / math.log(1.0 - self.AUTO_INFECTED_PROBABILITY))
+        if delay == 1:
+            self._auto_infect()
+            return True
+
+        self.auto_infection_tick = schedule.time + delay - 1
+        schedule.sleep(self, until=self.auto_infection_tick)
+        return True
+
+    def _wake_neighbors(self):
+        """Event activation: neighbours of a new infection can get infected."""
+        x, y = self.pos
+        palm_agents = self.model.palm_agents
+        schedule = self.model.schedule
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                neighbor = palm_agents.get((x + dx, y + dy))
+                if neighbor is not None and neighbor is not self:
+                    schedule.wake(neighbor)
 
     def _degrade_health(self):
         """Reduce health level with some randomness."""
@@ -98,16 +174,4 @@ class PalmAgent(Agent):
         Parameters:
         - amount (float): The amount of healing applied to this palm.
         """
-        if self.estado == "infectada":
-            self.health_level += amount
-
-            # Clamp the health level between 0 and 100
-            self.health_level = min(max(self.health_level, 0), 100)
-
-            if self.health_level > self.HEALTH_UMBRAL_MAX:
-                self.estado = "verde"
-                self.health_level = 100
-
-            elif self.health_level <= self.HEALTH_UMBRAL_MIN:
-                self.health_level = 0
-                self.estado = "muerta"
+        self.model.world.apply_medicine(self.pos, amount)
@@ -16,5 +16,15 @@ class Battery:
         # if drone by drone_id is in position over some of the stations. then recharge, if not not.
         self.level = min(self.capacity, self.level + amount)
 
+    def recharges_until_above(self, threshold, amount=33):
+        """Number of recharge() calls before the level exceeds threshold, None if it never does."""
+        if self.capacity <= threshold:
+            return None
+        level, recharges = self.level, 0
+        while level <= threshold:
+            level = min(self.capacity, level + amount)
+            recharges += 1
+        return recharges
+
     def is_low(self, threshold=20):
         return self.level <= threshold
@@ -0,0 +1,83 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import time
+import numpy as np
+
+from src.models.WorldState import PALM_INFECTADA
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Component : CVBackends.py --------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Classifiers behind CVModel. A backend takes a stack of photos
+# (palm state codes, shape (n_photos, rows, cols)) and returns
+# one VISION_DTYPE result per cell, in a single call, so a real
+# model can run one batched inference per tick for every drone.
+#
+# Backends:
+# - CVBackend: interface, subclasses implement predict()
+# - RandomCVBackend: the simulated classifier (exact labels,
+#   random confidence in [0.6, 0.99])
+# - DummyCVBackend: RandomCVBackend with an artificial latency
+#   per call and per photo, to measure batching gains
+# --------------------------------------------------------- #
+
+# Per-cell result of the CV model
+VISION_DTYPE = np.dtype([("infected", np.int8), ("confidence", np.float32)])
+
+
+class CVBackend:
+    """Interface of the CV classifiers used by CVModel."""
+
+    def predict(self, photos):
+        """
+        Args:
+            photos (3D array): stacked photos, shape (n_photos, rows, cols)
+
+        Returns:
+            np.ndarray (VISION_DTYPE): shape (n_photos, rows, cols)
+        """
+        raise NotImplementedError
+
+
+class RandomCVBackend(CVBackend):
+    """
+    Simulated classifier: labels are exact, confidences are random.
+
+    Parameters:
+    - rng (np.random.Generator): source of the confidences
+    """
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def predict(self, photos):
+        photos = np.asarray(photos)
+        result = np.empty(photos.shape, dtype=VISION_DTYPE)
+        result["infected"] = photos == PALM_INFECTADA
+        result["confidence"] = np.round(self.rng.uniform(0.6, 0.99, photos.shape), 4)
+        return result
+
+
+class DummyCVBackend(RandomCVBackend):
+    """
+    RandomCVBackend that sleeps like a real model would take to run.
+
+    Parameters:
+    - rng (np.random.Generator): source of the confidences
+    - latency (float): seconds per predict() call (fixed overhead)
+    - latency_per_photo (float): additional seconds per photo
+    """
+
+    def __init__(self, rng, latency=0.005, latency_per_photo=0.0):
+        super().__init__(rng)
+        self.latency = latency
+        self.latency_per_photo = latency_per_photo
+        self.calls = 0
+
+    def predict(self, photos):
+        self.calls += 1
+        time.sleep(self.latency + self.latency_per_photo * len(photos))
+        return super().predict(photos)
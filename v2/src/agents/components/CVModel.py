@@ -1,69 +1,88 @@
-import random
+import numpy as np
+
+from .CVBackends import VISION_DTYPE
+
 
 class CVModel:
     def __init__(self, model):
         self.model = model
+        self._offsets = {}      # {(rows, cols): (dx, dy)} flat cell offsets from the center
 
-    def analyze(self, photo_data):
+    def analyze(self, photo_data, center=None):
         """
-        Analyze each cell in photo_data and return a matrix of:
-        { 'infected': 0 or 1, 'confidence': float }
+        Analyze each cell in photo_data and return a structured array of:
+        ('infected': 0 or 1, 'confidence': float)
 
         Args:
-            photo_data (list of list): matrix with 'verde', 'infectada', or None
+            photo_data (2D array): palm state codes, as returned by Camera.take_photo
+            center (tuple): grid position of the photo, enables the model
+                inference cache (if any) for unchanged cells
 
         Returns:
-            list of list of dict: same shape with infection prediction per cell
+            np.ndarray (VISION_DTYPE): same shape with infection prediction per cell
         """
-        result_matrix = []
-
-        for row in photo_data:
-            result_row = []
-            for cell in row:
-                
-                # Simulate ML CV Model
-                infected = 1 if cell == "infectada" else 0
-                confidence = round(random.uniform(0.6, 0.99), 4)
-                result_row.append({
-                    "infected": infected,
-                    "confidence": confidence
-                })
-                
-            result_matrix.append(result_row)
-
-        return result_matrix
-
-    def convert_infected_matrix_to_dict(self, result, center_x, center_y):
+        photos = np.asarray(photo_data)[np.newaxis]
+        cache = self.model.inference_cache
+        if cache is not None and center is not None:
+            return cache.predict(self.model.cv_backend, self.model.world, photos, [center])[0]
+        return self.analyze_batch(photos)[0]
+
+    def analyze_batch(self, photos):
         """
-        Convert the infection matrix into a dictionary from the *center* position.
+        Analyze the photos of several drones in one call to the model
+        CV backend (see CVBackends).
 
         Args:
-            result (list of list of dict): Output from analyze()
-            center_x, center_y (int): center position of the drone in the grid
+            photos (3D array): stacked photos, shape (n_photos, rows, cols)
 
         Returns:
-            dict: {(x, y): confidence} for infected cells
+            np.ndarray (VISION_DTYPE): shape (n_photos, rows, cols)
         """
-        infected_dict = {}
+        return self.model.cv_backend.predict(photos)
+
+    def signed_confidence(self, result):
+        """Confidence per cell, positive if infected and negative otherwise."""
+        confidence = result["confidence"]
+        return np.where(result["infected"] == 1, confidence, -confidence)
 
-        height = len(result)
-        width = len(result[0]) if height > 0 else 0
+    def center_confidence(self, result):
+        """Signed confidence of the cell under the drone (photo center)."""
+        rows, cols = result.shape
+        infected, confidence = result[rows // 2, cols // 2].item()
+        return confidence if infected == 1 else -confidence
 
-        offset_y = height // 2
-        offset_x = width // 2
+    def _cell_offsets(self, shape):
+        offsets = self._offsets.get(shape)
+        if offsets is None:
+            rows, cols = shape
+            dy, dx = np.indices(shape)
+            offsets = ((dx - cols // 2).ravel(), (dy - rows // 2).ravel())
+            self._offsets[shape] = offsets
+        return offsets
 
-        for dy, row in enumerate(result):
-            for dx, cell in enumerate(row):
-                grid_x = center_x + (dx - offset_x)
-                grid_y = center_y + (dy - offset_y)
+    def detections(self, result, center_x, center_y):
+        """
+        Convert an analysis result into grid detections from the *center* position.
 
-                if (0 <= grid_x < self.model.grid.width) and (0 <= grid_y < self.model.grid.height):
-                    if cell["infected"] == 1:
-                        infected_dict[(grid_x, grid_y)] = cell["confidence"]  # ← Use tuple here
-                    else :
-                        infected_dict[(grid_x, grid_y)] = - cell["confidence"]
-        return infected_dict
+        Args:
+            result (np.ndarray): Output from analyze()
+            center_x, center_y (int): center position of the drone in the grid
+
+        Returns:
+            xs, ys (np.ndarray): int (n,) in-bounds cells, row by row
+            confidences (np.ndarray): float (n,) signed confidence per cell
+        """
+        dx, dy = self._cell_offsets(result.shape)
+        xs = center_x + dx
+        ys = center_y + dy
+        confidences = self.signed_confidence(result).ravel()
 
+        rows, cols = result.shape
+        width, height = self.model.grid.width, self.model.grid.height
+        if not (cols // 2 <= center_x < width - cols // 2 and rows // 2 <= center_y < height - rows // 2):
+            inside = (0 <= xs) & (xs < width) & (0 <= ys) & (ys < height)
+            xs, ys, confidences = xs[inside], ys[inside], confidences[inside]
+        return xs, ys, confidences
 
     def get_camera_value_by_photo(self, photo_data):
         return self.analyze(photo_data)
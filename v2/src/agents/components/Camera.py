@@ -1,25 +1,14 @@
 class Camera:
-    def __init__(self, model, radius=1):
+    def __init__(self, model, radius=None):
         self.model = model
-        self.radius = radius
+        self.radius = model.camera_radius if radius is None else radius
         self.last_photo = None
 
     def take_photo(self, pos):
-        """Returns a matrix of palm health status (or None) around the given position."""
-        x0, y0 = pos
-        result = []
-
-        for dy in range(-self.radius, self.radius + 1):
-            row = []
-            for dx in range(-self.radius, self.radius + 1):
-                x, y = x0 + dx, y0 + dy
-                if 0 <= x < self.model.grid.width and 0 <= y < self.model.grid.height:
-                    cell_agents = self.model.grid.get_cell_list_contents((x, y))
-                    palm = next((a for a in cell_agents if a.__class__.__name__ == "PalmAgent"), None)
-                    row.append(palm.estado if palm else None)
-                else:
-                    row.append(None)  # Outside the grid
-            result.append(row)
-
-        self.last_photo = result
-        return result
+        """
+        Returns the palm state codes (PALM_NONE outside the grid) around the
+        given position as a read-only [dy, dx] view of the world arrays.
+        No per-cell work is done, so the cost does not depend on the radius.
+        """
+        self.last_photo = self.model.world.palm_state_footprint(pos, self.radius)
+        return self.last_photo
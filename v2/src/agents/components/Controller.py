@@ -1,5 +1,7 @@
 # src/agents/components/Controller.py
+import ast
 import random
+from collections.abc import Mapping
 
 
 # Drone Finite State Machine (FSM) States
@@ -16,56 +18,37 @@ State_S8_DEATH                      = "death"                          # Fin del
 
 
 class Controller:
-    def __init__(self):
-        pass
+    def __init__(self, navigation):
+        # NavigationFields of the model: next hops toward goals
+        self.navigation = navigation
 
     def choose_best_target(self, targets, current_pos):
         """
-        Choose the closest infected palm (or highest confidence) as target.
-        Assumes targets is a list of dicts: [{"location": (x, y), "confidence": float}]
+        Choose the closest infected palm (Manhattan distance) as target.
+        `targets` is either a spatial index with a nearest(pos) method
+        (see TargetIndex) or a list of dicts:
+        [{"location": (x, y), "confidence": float}]
         """
-        print("\n--- choose_best_target DEBUG ---")
-        print(f"[Input] Current drone position: {current_pos}")
-        print(f"[Input] Targets (raw): {targets}")
-
         if not targets:
-            print("[Info] No targets provided. Returning None.")
             return None
 
-        try:
-            # Normalize the location field (convert strings to tuples)
-            normalized_targets = []
-            for t in targets:
-                loc = t["location"]
-                if isinstance(loc, str):
-                    try:
-                        loc = eval(loc)
-                    except Exception as e:
-                        print(f"[Error] Could not parse location string: {loc}, error: {e}")
-                        continue
-                normalized_targets.append({
-                    "location": loc,
-                    "confidence": t["confidence"]
-                })
-
-            # Sort by Manhattan distance
-            sorted_targets = sorted(
-                normalized_targets,
-                key=lambda t: self.manhattan_distance(current_pos, t["location"])
-            )
-
-            for i, t in enumerate(sorted_targets):
-                dist = self.manhattan_distance(current_pos, t["location"])
-                print(f"  {i+1}. Location: {t['location']}, Confidence: {t['confidence']:.4f}, Distance: {dist}")
-
-            selected = sorted_targets[0]["location"]
-            print(f"[Output] Selected target: {selected}")
-            print("--- END choose_best_target DEBUG ---\n")
-            return selected
-
-        except Exception as e:
-            print("[Fatal Error] Exception while choosing best target:", str(e))
-            return None
+        if hasattr(targets, "nearest"):
+            return targets.nearest(current_pos)
+
+        best, best_dist = None, None
+        for t in targets:
+            loc = t["location"]
+            if isinstance(loc, str):
+                try:
+                    loc = ast.literal_eval(loc)
+                except (ValueError, SyntaxError):
+                    continue
+
+            # Strict comparison keeps the first target on ties
+            dist = self.manhattan_distance(current_pos, loc)
+            if best is None or dist < best_dist:
+                best, best_dist = loc, dist
+        return best
 
 
     def explore(self, current_pos, last_pos, known_drones):
@@ -75,10 +58,11 @@ class Controller:
         - 30% chance to pick a random direction
         - Avoids collision with known drones
         """
+        occupied = self.occupied_cells(known_drones)
         possible_moves = self.get_neighborhood(current_pos)
         safe_moves = [
             move for move in possible_moves
-            if move not in known_drones.values()
+            if move not in occupied
         ]
 
         # Case: no safe moves → stay in place
@@ -106,24 +90,29 @@ class Controller:
         """
         Move one step toward goal, avoiding other drones.
         """
-        dx = goal[0] - current[0]
-        dy = goal[1] - current[1]
-
-        step_x = current[0] + (1 if dx > 0 else -1 if dx < 0 else 0)
-        step_y = current[1] + (1 if dy > 0 else -1 if dy < 0 else 0)
-
-        next_pos = (step_x, step_y)
+        next_pos = self.navigation.next_hop(current, goal)
 
         # Avoid collision if possible
-        if next_pos in known_drones.values():
+        occupied = self.occupied_cells(known_drones)
+        if next_pos in occupied:
             alternatives = self.get_neighborhood(current)
             for alt in alternatives:
-                if alt not in known_drones.values():
+                if alt not in occupied:
                     return alt
             return current  # stay if blocked
 
         return next_pos
 
+    def occupied_cells(self, known_drones):
+        """
+        Container answering `pos in occupied` for the drone cells:
+        a {drone_id: pos} dict is scanned, anything else (e.g. the model
+        DroneOccupancy) is queried directly.
+        """
+        if isinstance(known_drones, Mapping):
+            return known_drones.values()
+        return known_drones
+
     def get_nearest_station(self, current_pos):
         """
         Returns the hardcoded location of the nearest charging station.
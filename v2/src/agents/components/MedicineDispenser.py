@@ -17,14 +17,12 @@
 # - get_sensor_palm_health(position): return average palm health at position
 # --------------------------------------------------------- #
 
-from src.agents.PalmAgent import PalmAgent
-
 class MedicineDispenser:
     """
     MedicineDispenser is a utility component used in the simulation
     to treat infected PalmAgents by dispensing a limited resource (medicine).
 
-    It interacts with the grid to:
+    It interacts with the model world arrays to:
     - Apply healing to infected palms at a specific position
     - Track internal medicine usage and capacity
     - Provide sensing capability for average palm health at a location
@@ -54,12 +52,11 @@ class MedicineDispenser:
         if self.level < amount:
             return False  # Not enough medicine
 
-        agents = self.model.grid.get_cell_list_contents([position])
-        for agent in agents:
-            if isinstance(agent, PalmAgent) and agent.estado == "infectada":
-                agent.apply_medicine(amount)
-                self.level -= amount
-                return True
+        world = self.model.world
+        if world.get_palm_state(position) == "infectada":
+            world.apply_medicine(position, amount)
+            self.level -= amount
+            return True
 
         return False  # No infected palm found at position
 
@@ -73,13 +70,7 @@ class MedicineDispenser:
     
     def get_sensor_palm_health(self, position):
         """
-        Returns the average health level of all palms at a given position.
-        If no palms are found, returns None.
+        Returns the health level of the palm at a given position.
+        If no palm is found, returns None.
         """
-        agents = self.model.grid.get_cell_list_contents([position])
-        health_values = [
-            agent.health_level for agent in agents
-            if isinstance(agent, PalmAgent)
-        ]
-
-        return sum(health_values) / len(health_values) if health_values else None
+        return self.model.world.get_palm_health(position)
@@ -1,4 +1,8 @@
 # src/agents/components/Radio.py
+import numpy as np
+
+from src.models.TargetIndex import TargetIndex
+
 
 class Radio:
     def __init__(self, model, agent_id=None):
@@ -6,10 +10,23 @@ class Radio:
         self.agent_id = agent_id
         self.inbox = []
 
+        # Range-limited mode: what this drone heard from the drones around
+        # it, instead of the global blackboard (see RadioNetwork)
+        self.network = model.radio_network
+        self.targets = None     # TargetIndex of the locally known targets
+        self.neighbors = {}     # {drone_id: (x, y)} heard since the last receive()
+        self.cured = []         # cure reports for the next broadcast
+        if self.network is not None and agent_id is not None:
+            self.targets = TargetIndex(model.width, model.height)
+            self.network.register(agent_id, self)
+
     # --- Blackboard writes ---
     def publish_blackboard_palms_target(self, position, confidence):
         self.model.update_blackboard_palms_targets(position, confidence)
 
+    def publish_blackboard_detections(self, xs, ys, confidences):
+        self.model.update_blackboard_detections(xs, ys, confidences)
+
     def publish_blackboard_drones_position(self, position):
         if self.agent_id is not None:
             self.model.update_blackboard_drone_positions(self.agent_id, position)
@@ -18,11 +35,81 @@ class Radio:
     def read_blackboard_charging_stations_positions(self):
         return self.model.get_blackboard_charging_stations_positions()
     
+    def read_nearest_charging_station(self, position):
+        return self.model.get_nearest_charging_station(position)
+
     def read_blackboard_palms_targets(self):
         return self.model.get_blackboard_palms_targets()
 
+    def read_blackboard_targets_index(self):
+        return self.model.get_blackboard_targets_index()
+
+    def read_blackboard_targets_assignments(self):
+        return self.model.get_blackboard_targets_assignments()
+
+    def read_drones_occupancy(self):
+        return self.model.get_drones_occupancy()
+
     def read_blackboard_drones_positions(self):
         return self.model.get_blackboard_drones_positions()
 
     def report_palm_cured(self, position, confidence = 0):
-        self.model.report_palm_cured(position, confidence)
\ No newline at end of file
+        self.model.report_palm_cured(position, confidence)
+        if self.targets is not None:
+            self.cured.append((position, confidence))
+            self._remove_target(position, confidence)
+
+    # --- Range-limited radio ---
+    def broadcast(self, position, detections=None):
+        """
+        Send the position, the detections of the last photo and the pending
+        cure reports to the drones in range. Own detections update the
+        local targets right away.
+        """
+        if detections is not None:
+            self._apply_detections(*detections)
+
+        message = {
+            "sender": self.agent_id,
+            "position": position,
+            "detections": detections,
+            "cured": self.cured,
+        }
+        self.cured = []
+        self.network.broadcast(message)
+
+    def receive(self):
+        """Merge the inbox into the local knowledge and empty it."""
+        inbox, self.inbox = self.inbox, []
+        self.neighbors = {}
+        detections = []
+        cured = []
+        for message in inbox:
+            self.neighbors[message["sender"]] = message["position"]
+            if message["detections"] is not None:
+                detections.append(message["detections"])
+            cured.extend(message["cured"])
+
+        if detections:
+            self._apply_detections(np.concatenate([d[0] for d in detections]),
+                                   np.concatenate([d[1] for d in detections]),
+                                   np.concatenate([d[2] for d in detections]))
+        for position, confidence in cured:
+            self._remove_target(position, confidence)
+
+    def _apply_detections(self, xs, ys, confidences):
+        # Same thresholds as the blackboard (PalmerasModel._apply_detections)
+        infected = confidences > 0
+        for x, y in zip(xs[infected].tolist(), ys[infected].tolist()):
+            self.targets.add((x, y))
+
+        # Most cells are seen healthy, only the known targets among them matter
+        healthy = confidences < -0.5
+        if len(self.targets) and healthy.any():
+            seen = zip(xs[healthy].tolist(), ys[healthy].tolist())
+            for position in self.targets.intersection(seen):
+                self.targets.remove(position)
+
+    def _remove_target(self, position, confidence):
+        if abs(confidence) > 0.5:
+            self.targets.remove(position)
\ No newline at end of file
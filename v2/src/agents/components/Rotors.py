@@ -3,7 +3,17 @@ class Rotors:
         self.model = model
 
     def move(self, drone, next_pos):
+        # With a reservation table the move is only proposed here, the
+        # model applies every resolved move at once (see apply)
+        reservations = self.model.reservations
+        if reservations is not None:
+            reservations.propose(drone, next_pos)
+            return
+        self.apply(drone, next_pos)
+
+    def apply(self, drone, next_pos):
         if self.in_bounds(next_pos) and drone.battery.get_level() > 0:
+            self.model.occupancy.move(drone.pos, next_pos)
             self.model.grid.move_agent(drone, next_pos)
             drone.gps.set_position(*next_pos)
             drone.battery.consume(1)
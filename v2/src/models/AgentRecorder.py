@@ -0,0 +1,304 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import numpy as np
+import pandas as pd
+
+from src.agents.DroneAgent import DroneAgent
+from src.agents.PalmAgent import PalmAgent
+from src.agents.components.Controller import (
+    State_S0_INIT, State_S1_IDLE, State_S2_EXPLORING, State_S3_MOVING_TO_TARGET,
+    State_S4_CURING, State_S5_GOING_TO_CHARGING_STATION, State_S6_CHARGING,
+    State_S7_EMERGENCY_RETURN, State_S8_DEATH
+)
+from src.models.WorldState import PALM_NONE, PALM_STATE_NAMES
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : AgentRecorder.py ---------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Columnar replacement for the DataCollector agent_reporters.
+# Drone and palm attributes are written every step into typed,
+# preallocated per-type column arrays; static agents (grid
+# cells, charging stations) are logged once.
+#
+# Columns per type:
+# - drones: state (int8), battery (float32), x/y (int16),
+#           target x/y (int16, -1 = None), on_mission,
+#           is_charging, is_curing (bool)
+# - palms:  state (int8), health (float32); x/y are static
+#
+# Methods:
+# - collect(): record the current step
+# - snapshot() / drain(): recorded columns (drain also clears)
+# - get_agent_vars_dataframe(): Mesa-compatible DataFrame
+# --------------------------------------------------------- #
+
+DRONE_STATES = [
+    State_S0_INIT, State_S1_IDLE, State_S2_EXPLORING, State_S3_MOVING_TO_TARGET,
+    State_S4_CURING, State_S5_GOING_TO_CHARGING_STATION, State_S6_CHARGING,
+    State_S7_EMERGENCY_RETURN, State_S8_DEATH
+]
+
+AGENT_COLUMNS = [
+    "pos", "x", "y", "agent_type", "agent_state", "palm_health",
+    "drone_battery_level", "drone_position_target",
+    "drone_on_mission", "drone_is_charging", "drone_is_curing"
+]
+
+
+class AgentRecorder:
+    """
+    AgentRecorder stores per-step agent data in NumPy columns.
+
+    Palms are identified by their cell: with the agents engine the
+    PalmAgent unique_id is used, with the arrays engine ids are reserved
+    from the model id counter at construction. The palm population is
+    fixed after initialization, so palm positions are stored once.
+
+    Parameters:
+    - model: the PalmerasModel to record
+    - capacity (int): initial number of steps to preallocate; the
+      columns grow geometrically when exceeded
+    """
+
+    def __init__(self, model, capacity=128):
+        self.model = model
+        self.capacity = max(1, capacity)
+        self.n_steps = 0
+        self.steps = np.zeros(self.capacity, dtype=np.int32)
+
+        self.drone_state_names = list(DRONE_STATES)
+        self._drone_state_codes = {name: i for i, name in enumerate(self.drone_state_names)}
+
+        self._init_static()
+        self._init_drones()
+        self._init_palms()
+
+    # --- Initialization ---
+    def _init_static(self):
+        self.static_rows = [
+            (agent.unique_id, agent.pos[0], agent.pos[1], type(agent).__name__)
+            for agent in self.model.schedule.agents
+            if not isinstance(agent, (DroneAgent, PalmAgent))
+        ]
+        self.static_step = None
+
+    def _init_drones(self):
+        self.drones = [a for a in self.model.schedule.agents if isinstance(a, DroneAgent)]
+        self.drone_ids = np.array([d.unique_id for d in self.drones], dtype=np.int64)
+
+        shape = (self.capacity, len(self.drones))
+        self.drone_columns = {
+            "state": np.zeros(shape, dtype=np.int8),
+            "battery": np.zeros(shape, dtype=np.float32),
+            "x": np.zeros(shape, dtype=np.int16),
+            "y": np.zeros(shape, dtype=np.int16),
+            "target_x": np.zeros(shape, dtype=np.int16),
+            "target_y": np.zeros(shape, dtype=np.int16),
+            "on_mission": np.zeros(shape, dtype=bool),
+            "is_charging": np.zeros(shape, dtype=bool),
+            "is_curing": np.zeros(shape, dtype=bool),
+        }
+
+    def _init_palms(self):
+        world = self.model.world
+        palm_agents = self.model.palm_agents
+
+        positions = np.argwhere(world.palm_state != PALM_NONE)
+        self.palm_x = positions[:, 0].astype(np.int16)
+        self.palm_y = positions[:, 1].astype(np.int16)
+
+        if palm_agents:
+            ids = [palm_agents[(x, y)].unique_id for x, y in positions.tolist()]
+            self.palm_ids = np.array(ids, dtype=np.int64)
+        else:
+            start = self.model.current_id + 1
+            self.model.current_id += len(positions)
+            self.palm_ids = np.arange(start, start + len(positions), dtype=np.int64)
+
+        shape = (self.capacity, len(positions))
+        self.palm_columns = {
+            "state": np.zeros(shape, dtype=np.int8),
+            "health": np.zeros(shape, dtype=np.float32),
+        }
+
+    # --- Recording ---
+    def collect(self):
+        """Record drones and palms for the current schedule step."""
+        if self.n_steps == self.capacity:
+            self._grow()
+
+        row = self.n_steps
+        self.steps[row] = self.model.schedule.steps
+        if self.static_step is None:
+            self.static_step = self.model.schedule.steps
+
+        self._collect_drones(row)
+        self._collect_palms(row)
+        self.n_steps += 1
+
+    def _collect_drones(self, row):
+        if not self.drones:
+            return
+
+        columns = self.drone_columns
+        targets = [d.target if d.target is not None else (-1, -1) for d in self.drones]
+
+        columns["state"][row] = [self._drone_state_code(d.state) for d in self.drones]
+        columns["battery"][row] = [d.battery.get_level() for d in self.drones]
+        columns["x"][row] = [d.pos[0] for d in self.drones]
+        columns["y"][row] = [d.pos[1] for d in self.drones]
+        columns["target_x"][row] = [t[0] for t in targets]
+        columns["target_y"][row] = [t[1] for t in targets]
+        columns["on_mission"][row] = [d.on_mission for d in self.drones]
+        columns["is_charging"][row] = [d.is_charging for d in self.drones]
+        columns["is_curing"][row] = [d.is_curing for d in self.drones]
+
+    def _collect_palms(self, row):
+        world = self.model.world
+        self.palm_columns["state"][row] = world.palm_state[self.palm_x, self.palm_y]
+        self.palm_columns["health"][row] = world.palm_health[self.palm_x, self.palm_y]
+
+    def _drone_state_code(self, state):
+        code = self._drone_state_codes.get(state)
+        if code is None:
+            code = len(self.drone_state_names)
+            self.drone_state_names.append(state)
+            self._drone_state_codes[state] = code
+        return code
+
+    def _grow(self):
+        self.capacity *= 2
+        self.steps = self._resized(self.steps)
+        for columns in (self.drone_columns, self.palm_columns):
+            for name, values in columns.items():
+                columns[name] = self._resized(values)
+
+    def _resized(self, values):
+        grown = np.zeros((self.capacity,) + values.shape[1:], dtype=values.dtype)
+        grown[:len(values)] = values
+        return grown
+
+    # --- Export ---
+    def snapshot(self):
+        """
+        Return the recorded rows as a dict of trimmed column arrays:
+        {"steps", "drone_ids", "drone_state_names", "drones": {...},
+         "palm_ids", "palm_x", "palm_y", "palms": {...}}
+        """
+        n = self.n_steps
+        return {
+            "steps": self.steps[:n].copy(),
+            "drone_ids": self.drone_ids,
+            "drone_state_names": list(self.drone_state_names),
+            "drones": {name: values[:n].copy() for name, values in self.drone_columns.items()},
+            "palm_ids": self.palm_ids,
+            "palm_x": self.palm_x,
+            "palm_y": self.palm_y,
+            "palms": {name: values[:n].copy() for name, values in self.palm_columns.items()},
+        }
+
+    def drain(self):
+        """Return snapshot() and forget the recorded rows, keeping the buffers."""
+        record = self.snapshot()
+        self.n_steps = 0
+        return record
+
+    def static_record(self):
+        """Return the once-logged static agents as {"step", "ids", "x", "y", "types"}."""
+        ids, xs, ys, types = zip(*self.static_rows) if self.static_rows else ((), (), (), ())
+        return {"step": self.static_step, "ids": ids, "x": xs, "y": ys, "types": types}
+
+    def get_agent_vars_dataframe(self):
+        """
+        Build a DataFrame with the same layout as
+        DataCollector.get_agent_vars_dataframe(): indexed by
+        (Step, AgentID), one column per former agent reporter.
+        """
+        return build_agent_dataframe(self.snapshot(), self.static_record())
+
+
+# --------------------------------------------------------- #
+# --- DataFrame builders ---------------------------------- #
+# --------------------------------------------------------- #
+
+def build_agent_dataframe(record, static=None):
+    """Build the Mesa-compatible agent DataFrame from recorder columns."""
+    frames = [_static_frame(static), _drones_frame(record), _palms_frame(record)]
+    frames = [f for f in frames if f is not None and len(f)]
+    if not frames:
+        index = pd.MultiIndex.from_tuples([], names=["Step", "AgentID"])
+        return pd.DataFrame(columns=AGENT_COLUMNS, index=index)
+
+    df = pd.concat(frames)
+    df = df.set_index(["Step", "AgentID"]).sort_index()
+    return df[AGENT_COLUMNS]
+
+
+def _static_frame(static):
+    if static is None or static["step"] is None or not len(static["ids"]):
+        return None
+
+    xs, ys = list(static["x"]), list(static["y"])
+    return pd.DataFrame({
+        "Step": static["step"],
+        "AgentID": list(static["ids"]),
+        "pos": list(zip(xs, ys)),
+        "x": xs,
+        "y": ys,
+        "agent_type": list(static["types"]),
+    })
+
+
+def _drones_frame(record):
+    steps, ids = record["steps"], record["drone_ids"]
+    n, d = len(steps), len(ids)
+    if not n or not d:
+        return None
+
+    columns = {name: values.ravel() for name, values in record["drones"].items()}
+    state_names = np.array(record["drone_state_names"], dtype=object)
+    targets = [
+        (tx, ty) if tx >= 0 else None
+        for tx, ty in zip(columns["target_x"].tolist(), columns["target_y"].tolist())
+    ]
+    xs, ys = columns["x"].tolist(), columns["y"].tolist()
+
+    return pd.DataFrame({
+        "Step": np.repeat(steps, d),
+        "AgentID": np.tile(ids, n),
+        "pos": list(zip(xs, ys)),
+        "x": xs,
+        "y": ys,
+        "agent_type": "DroneAgent",
+        "agent_state": state_names[columns["state"]],
+        "drone_battery_level": columns["battery"],
+        "drone_position_target": targets,
+        "drone_on_mission": columns["on_mission"],
+        "drone_is_charging": columns["is_charging"],
+        "drone_is_curing": columns["is_curing"],
+    })
+
+
+def _palms_frame(record):
+    steps, ids = record["steps"], record["palm_ids"]
+    n, p = len(steps), len(ids)
+    if not n or not p:
+        return None
+
+    state_names = np.array(PALM_STATE_NAMES, dtype=object)
+    xs = np.tile(record["palm_x"], n).tolist()
+    ys = np.tile(record["palm_y"], n).tolist()
+
+    return pd.DataFrame({
+        "Step": np.repeat(steps, p),
+        "AgentID": np.tile(ids, n),
+        "pos": list(zip(xs, ys)),
+        "x": xs,
+        "y": ys,
+        "agent_type": "PalmAgent",
+        "agent_state": state_names[record["palms"]["state"].ravel()],
+        "palm_health": record["palms"]["health"].ravel(),
+    })
@@ -0,0 +1,110 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+from types import MappingProxyType
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : Blackboard.py ------------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Shared memory of the drone fleet, organized in sections (one
+# dict each). Writes go through set() / delete() / replace(),
+# which bump the version of the section only when its content
+# actually changes. Reads are read-only views of the live dicts,
+# or immutable snapshots cached per section version: a reader
+# asking again for an unchanged section gets the same object
+# back without any copying.
+#
+# Dict-like reads (blackboard["palms_targets"], .get()) keep
+# working, but return read-only views.
+#
+# Sections:
+# - palms_targets: { (x, y): confidence }
+# - drones_positions: { drone_id: (x, y) }
+# - targets_assignments: { drone_id: (x, y) }, with target_allocation
+# - charging_stations_positions: { (x, y): assigned drone index }
+# --------------------------------------------------------- #
+
+SECTIONS = (
+    "palms_targets",
+    "drones_positions",
+    "targets_assignments",
+    "charging_stations_positions",
+)
+
+
+class Blackboard:
+    """
+    Blackboard with per-section versions and cached snapshots.
+
+    Attributes:
+    - version (int): bumped on every effective write to any section
+    """
+
+    def __init__(self, sections=SECTIONS):
+        self._data = {name: {} for name in sections}
+        self._views = {name: MappingProxyType(data) for name, data in self._data.items()}
+        self._versions = {name: 0 for name in sections}
+        self._snapshots = {}    # {(section, build): (version, snapshot)}
+        self.version = 0
+
+    # --- Dict-like reads ---
+    def __getitem__(self, section):
+        return self._views[section]
+
+    def get(self, section, default=None):
+        return self._views.get(section, default)
+
+    def __contains__(self, section):
+        return section in self._views
+
+    def keys(self):
+        return self._views.keys()
+
+    def section_version(self, section):
+        return self._versions[section]
+
+    # --- Writes ---
+    def _touch(self, section):
+        self._versions[section] += 1
+        self.version += 1
+
+    def set(self, section, key, value):
+        data = self._data[section]
+        if key in data and data[key] == value:
+            return
+        data[key] = value
+        self._touch(section)
+
+    def delete(self, section, key):
+        data = self._data[section]
+        if key in data:
+            del data[key]
+            self._touch(section)
+
+    def replace(self, section, mapping):
+        """Replace the whole content of a section."""
+        data = self._data[section]
+        if data == mapping:
+            return
+        data.clear()
+        data.update(mapping)
+        self._touch(section)
+
+    # --- Snapshots ---
+    def snapshot(self, section, build=None):
+        """
+        Immutable snapshot of a section, rebuilt only after it changes.
+        `build(data)` turns the section dict into the snapshot (a frozen
+        copy of the dict by default); every builder is cached separately.
+        """
+        version = self._versions[section]
+        cached = self._snapshots.get((section, build))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        data = self._data[section]
+        snapshot = build(data) if build is not None else MappingProxyType(dict(data))
+        self._snapshots[(section, build)] = (version, snapshot)
+        return snapshot
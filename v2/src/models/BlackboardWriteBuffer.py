@@ -0,0 +1,59 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import numpy as np
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : BlackboardWriteBuffer.py -------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Back buffer of the blackboard. While a tick runs, drones only
+# append their writes here, so every drone reads the state
+# committed at the end of the previous tick. The model drains
+# the buffer once per tick and merges everything in one pass
+# (see PalmerasModel.commit_blackboard_writes).
+#
+# Writes:
+# - drone positions: only the last position of each drone is kept
+# - detections: (xs, ys, confidences) arrays, concatenated on drain
+# - cure reports: (position, confidence), in order
+# --------------------------------------------------------- #
+
+
+class BlackboardWriteBuffer:
+    """BlackboardWriteBuffer collects the blackboard writes of one tick."""
+
+    def __init__(self):
+        self.positions = {}     # {drone_id: (x, y)}
+        self.detections = []    # list of (xs, ys, confidences)
+        self.cured = []         # list of ((x, y), confidence)
+
+    def __len__(self):
+        return len(self.positions) + len(self.detections) + len(self.cured)
+
+    def add_position(self, agent_id, position):
+        self.positions[agent_id] = position
+
+    def add_detections(self, xs, ys, confidences):
+        self.detections.append((xs, ys, confidences))
+
+    def add_cured(self, position, confidence):
+        self.cured.append((position, confidence))
+
+    def drain(self):
+        """
+        Return and clear the pending writes as
+        (positions, xs, ys, confidences, cured), detections in write order.
+        """
+        positions, detections, cured = self.positions, self.detections, self.cured
+        self.positions, self.detections, self.cured = {}, [], []
+
+        if detections:
+            xs = np.concatenate([d[0] for d in detections])
+            ys = np.concatenate([d[1] for d in detections])
+            confidences = np.concatenate([d[2] for d in detections])
+        else:
+            xs = ys = np.empty(0, dtype=np.int64)
+            confidences = np.empty(0, dtype=np.float32)
+        return positions, xs, ys, confidences, cured
@@ -0,0 +1,48 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import numpy as np
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : DroneOccupancy.py --------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Number of drones on every cell, kept up to date by Rotors.move.
+# Collision checks of the Controller become one array read
+# (`pos in occupancy`) instead of a scan over every published
+# drone position.
+#
+# Methods:
+# - add(pos), move(old, new): keep the counts in sync
+# - __contains__(pos): True if at least one drone is on pos
+# --------------------------------------------------------- #
+
+
+class DroneOccupancy:
+    """
+    DroneOccupancy is a per-cell drone count over the grid.
+
+    Parameters:
+    - width, height (int): grid size
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.counts = np.zeros((width, height), dtype=np.int16)
+
+    def add(self, pos):
+        self.counts[pos] += 1
+
+    def remove(self, pos):
+        self.counts[pos] -= 1
+
+    def move(self, old, new):
+        if old != new:
+            self.counts[old] -= 1
+            self.counts[new] += 1
+
+    def __contains__(self, pos):
+        x, y = pos
+        return 0 <= x < self.width and 0 <= y < self.height and self.counts[x, y] > 0
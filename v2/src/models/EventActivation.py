@@ -0,0 +1,92 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import heapq
+import itertools
+from src.models.TypedActivation import TypedActivation
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Scheduler : EventActivation.py ---------------------- #
+# --------------------------------------------------------- #
+# Description:
+# TypedActivation where agents that cannot change state for a
+# while go to sleep instead of being stepped every tick:
+# - sleep(agent, until): leave the active set, optionally with a
+#   wake-up tick (e.g. the end of a charge)
+# - wake(agent): back to the active set, from the next step on
+#   (e.g. a palm whose neighbour just got infected)
+#
+# Timed wake-ups live in a heap, so a step only costs the agents
+# that are awake plus the wake-ups that are due. Entries of
+# agents woken early or put back to sleep with another tick are
+# dropped lazily when they come out of the heap.
+#
+# Agents stepped outside the schedule (see deactivate) can sleep
+# too; waking them does not make the schedule step them.
+# --------------------------------------------------------- #
+
+
+class EventActivation(TypedActivation):
+    """
+    Scheduler with sleeping agents and a wake-up queue.
+
+    Parameters:
+    - model: the Mesa model
+    - static_types (tuple): agent classes that never need to step
+    """
+
+    def __init__(self, model, static_types=()):
+        super().__init__(model, static_types)
+        self._asleep = {}                  # {unique_id: (agent, wake tick or None, was active)}
+        self._wakeups = []                 # heap of (tick, seq, unique_id)
+        self._seq = itertools.count()      # FIFO order among equal ticks
+
+    def remove(self, agent):
+        super().remove(agent)
+        self._asleep.pop(agent.unique_id, None)
+
+    def deactivate(self, agent):
+        super().deactivate(agent)
+        self._asleep.pop(agent.unique_id, None)
+
+    # --- Sleep / wake ---
+    def sleep(self, agent, until=None):
+        """
+        Stop stepping an agent until wake() is called or, if `until` is
+        given, until the step at that schedule time.
+        """
+        key = agent.unique_id
+        was_active = self._active.pop(key, None) is not None
+        previous = self._asleep.get(key)
+        if previous is not None:
+            was_active = previous[2]
+
+        self._asleep[key] = (agent, until, was_active)
+        if until is not None:
+            heapq.heappush(self._wakeups, (until, next(self._seq), key))
+
+    def wake(self, agent):
+        entry = self._asleep.pop(agent.unique_id, None)
+        if entry is not None and entry[2]:
+            self._active[agent.unique_id] = agent
+
+    def is_asleep(self, agent):
+        return agent.unique_id in self._asleep
+
+    def get_asleep_count(self):
+        return len(self._asleep)
+
+    def wake_due(self):
+        """Wake the agents whose wake-up tick has come (safe to call twice per step)."""
+        wakeups = self._wakeups
+        while wakeups and wakeups[0][0] <= self.time:
+            tick, _, key = heapq.heappop(wakeups)
+            entry = self._asleep.get(key)
+            if entry is not None and entry[1] == tick:
+                self.wake(entry[0])
+
+    def step(self):
+        """Wake the agents that are due, then step every awake agent."""
+        self.wake_due()
+        super().step()
@@ -0,0 +1,122 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import numpy as np
+
+from src.agents.components.CVBackends import VISION_DTYPE
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : InferenceCache.py --------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Per-cell cache of CV results. The cached result of a cell is
+# valid while the palm version of the cell (WorldState.palm_version,
+# bumped on every palm state or health change) is the one it was
+# computed for, so re-photographing an unchanged cell costs no
+# inference.
+#
+# The cache is two arrays padded like the world arrays: the
+# cached version and the cached result of every cell. A single
+# photo is checked against the palm versions with slices, a
+# batch of photos with one gather; only the cells that miss are
+# sent to the backend, as 1x1 crops stacked into one predict()
+# call, and a photo whose cells are all cached makes no backend
+# call at all.
+#
+# Covering the whole grid costs 9 bytes per cell, so there is no
+# capacity limit and no eviction.
+#
+# Methods:
+# - predict(backend, world, photos, centers): cached inference
+# --------------------------------------------------------- #
+
+# Cached version of cells never analyzed (palm versions start at 0)
+NO_VERSION = np.iinfo(np.uint32).max
+
+
+class InferenceCache:
+    """
+    InferenceCache keeps the last CV result of every cell of a world.
+
+    Parameters:
+    - world (WorldState): grid whose palm versions validate the results
+    """
+
+    def __init__(self, world):
+        shape = world.palm_version_padded.shape
+        self.pad = world.pad
+        self.version = np.full(shape, NO_VERSION, dtype=np.uint32)
+        self.results = np.zeros(shape, dtype=VISION_DTYPE)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return int(np.count_nonzero(self.version != NO_VERSION))
+
+    def predict(self, backend, world, photos, centers):
+        """
+        Same result as backend.predict(photos), reusing cached cells.
+
+        Parameters:
+        - backend (CVBackend): classifier for the missing cells
+        - world (WorldState): source of the palm versions
+        - photos (3D array): stacked photos, shape (n_photos, rows, cols)
+        - centers (list): grid position each photo was taken from
+        """
+        photos = np.asarray(photos)
+        n_photos, rows, cols = photos.shape
+        if n_photos == 1:
+            return self._predict_one(backend, world, photos, centers[0])
+
+        # Padded [x, y] indices of every photo cell, photo[i, dy, dx]
+        centers = np.asarray(centers, dtype=np.intp).reshape(-1, 2)
+        xs = (centers[:, 0] + (self.pad - cols // 2))[:, None, None] + np.arange(cols)[None, None, :]
+        ys = (centers[:, 1] + (self.pad - rows // 2))[:, None, None] + np.arange(rows)[None, :, None]
+        xs, ys = np.broadcast_arrays(xs, ys)
+
+        versions = world.palm_version_padded[xs, ys]
+        missing = self.version[xs, ys] != versions
+
+        result = self.results[xs, ys]
+
+        n_missing = int(np.count_nonzero(missing))
+        self.hits += missing.size - n_missing
+        if not n_missing:
+            return result
+
+        # One crop per distinct missing cell, even if several photos see it
+        miss_x, miss_y = xs[missing], ys[missing]
+        flat = miss_x * self.version.shape[1] + miss_y
+        _, first, inverse = np.unique(flat, return_index=True, return_inverse=True)
+        self.misses += len(first)
+
+        crops = photos[missing][first].reshape(-1, 1, 1)
+        predicted = backend.predict(crops)[:, 0, 0]
+        result[missing] = predicted[inverse]
+
+        cells = (miss_x[first], miss_y[first])
+        self.version[cells] = versions[missing][first]
+        self.results[cells] = predicted
+        return result
+
+    def _predict_one(self, backend, world, photos, center):
+        """predict() for one photo: plain slices, every cell is distinct."""
+        _, rows, cols = photos.shape
+        x0 = center[0] + self.pad - cols // 2
+        y0 = center[1] + self.pad - rows // 2
+        cells = (slice(x0, x0 + cols), slice(y0, y0 + rows))
+
+        # Transposed views are indexed [dy, dx] like the photos
+        versions = world.palm_version_padded[cells].T
+        cached_versions = self.version[cells].T
+        cached_results = self.results[cells].T
+
+        missing = cached_versions != versions
+        n_missing = int(np.count_nonzero(missing))
+        self.hits += missing.size - n_missing
+        if n_missing:
+            self.misses += n_missing
+            cached_results[missing] = backend.predict(photos[0][missing].reshape(-1, 1, 1))[:, 0, 0]
+            cached_versions[missing] = versions[missing]
+        return cached_results.copy()[np.newaxis]
@@ -0,0 +1,71 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import numpy as np
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : InferenceQueue.py --------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Per-tick queue of CV inference requests. Drones submit their
+# photo during the sensing stage; run() stacks every pending
+# photo and calls the backend once per photo shape, then hands
+# each result back to the drone that submitted it.
+#
+# With an InferenceCache, cells whose palm has not changed since
+# they were last analyzed are not sent to the backend again.
+#
+# Methods:
+# - submit(photo, callback, center): queue a photo, callback(result) later
+# - run(): one batched predict() over the pending photos
+# --------------------------------------------------------- #
+
+
+class InferenceQueue:
+    """
+    InferenceQueue batches the photos of a tick for a CVBackend.
+
+    Parameters:
+    - backend (CVBackend): classifier used by run()
+    - cache (InferenceCache): optional per-cell result cache
+    - world (WorldState): palm versions for the cache
+    """
+
+    def __init__(self, backend, cache=None, world=None):
+        self.backend = backend
+        self.cache = cache
+        self.world = world
+        self.pending = []       # list of (photo, callback, center)
+        self.batches = 0        # number of predict() calls so far
+        self.photos = 0         # number of photos analyzed so far
+
+    def submit(self, photo, callback, center=None):
+        """Queue a photo; center (grid position of the photo) enables the cache."""
+        self.pending.append((photo, callback, center))
+
+    def __len__(self):
+        return len(self.pending)
+
+    def run(self):
+        """Analyze every pending photo and deliver the results."""
+        if not self.pending:
+            return
+
+        # Photos of different sizes cannot be stacked together
+        by_shape = {}
+        for request in self.pending:
+            by_shape.setdefault(request[0].shape, []).append(request)
+        self.pending = []
+
+        for requests in by_shape.values():
+            photos = np.stack([photo for photo, _, _ in requests])
+            centers = [center for _, _, center in requests]
+            if self.cache is not None and None not in centers:
+                results = self.cache.predict(self.backend, self.world, photos, centers)
+            else:
+                results = self.backend.predict(photos)
+            self.batches += 1
+            self.photos += len(requests)
+            for (_, callback, _), result in zip(requests, results):
+                callback(result)
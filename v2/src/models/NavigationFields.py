@@ -0,0 +1,37 @@
+# --------------------------------------------------------- #
+# --- Model : NavigationFields.py ------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Next hops toward navigation goals (charging stations,
+# targets).
+#
+# Drones move in the Moore neighbourhood and the grid has no
+# obstacles, so the next hop on a shortest path is the diagonal
+# step toward the goal. It is computed in closed form, in O(1)
+# and without any allocation, so there is no field to build or
+# cache. Distances to the charging stations come from StationMap.
+#
+# Methods:
+# - next_hop(pos, goal): first cell of a shortest path to goal
+# --------------------------------------------------------- #
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+class NavigationFields:
+    """
+    NavigationFields answers next hop queries toward goals.
+
+    Parameters:
+    - width, height (int): grid size
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def next_hop(self, pos, goal):
+        """Cell to move to from pos on a shortest path to goal."""
+        return (pos[0] + _sign(goal[0] - pos[0]), pos[1] + _sign(goal[1] - pos[1]))
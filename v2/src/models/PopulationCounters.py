@@ -0,0 +1,68 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import numpy as np
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : PopulationCounters.py ----------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Population counters updated on state transitions instead of
+# being recomputed by scanning every agent each tick. The model
+# reporters only read them, so data collection is O(1).
+#
+# Attributes:
+# - palms (np.ndarray): number of palms per state code
+# - drones (int): number of drones in the model
+# - drones_charging (int): number of drones with is_charging set
+#
+# Methods:
+# - palm_transition(old, new, count): palms changed between two states
+# - palm_transitions(old, new): many palms changed state at once
+# - drone_added(), drone_charging_changed(is_charging)
+# --------------------------------------------------------- #
+
+
+class PopulationCounters:
+    """
+    PopulationCounters keeps the palm and drone population sizes used
+    by the DataCollector model reporters.
+
+    Palm states are tracked by the integer codes of WorldState
+    (PALM_NONE, PALM_VERDE, PALM_INFECTADA, PALM_MUERTA); index 0 counts
+    cells without a palm and is never reported.
+    """
+
+    def __init__(self, n_palm_states=4):
+        self.palms = np.zeros(n_palm_states, dtype=np.int64)
+        self.drones = 0
+        self.drones_charging = 0
+
+    # --- Palms ---
+    def palm_transition(self, old, new, count=1):
+        if old != new:
+            self.palms[old] -= count
+            self.palms[new] += count
+
+    def palm_transitions(self, old, new):
+        """Apply a batch of transitions given as arrays of old and new codes."""
+        size = len(self.palms)
+        self.palms -= np.bincount(old, minlength=size)
+        self.palms += np.bincount(new, minlength=size)
+
+    def count_palms(self):
+        return int(self.palms[1:].sum())
+
+    def count_palm_state(self, code):
+        return int(self.palms[code])
+
+    # --- Drones ---
+    def drone_added(self):
+        self.drones += 1
+
+    def drone_charging_changed(self, is_charging):
+        self.drones_charging += 1 if is_charging else -1
+
+    def count_drones_active(self):
+        return self.drones - self.drones_charging
@@ -0,0 +1,63 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+from src.models.SpatialHash import SpatialHash
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : RadioNetwork.py ----------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Range-limited radio channel between the drones, used instead
+# of the global blackboard when the model has a `radio_range`.
+# A broadcast is delivered to the inbox of every registered
+# radio within range of the sender (Chebyshev distance, sender
+# excluded). Neighbours are found through a SpatialHash with
+# buckets of `radio_range` cells, so delivering a message costs
+# the number of drones around the sender, not the fleet size.
+#
+# The position of a radio is the one of its last broadcast.
+#
+# Messages (dict):
+# - sender: drone id
+# - position: (x, y) of the sender
+# - detections: (xs, ys, confidences) arrays of its last photo, or None
+# - cured: list of ((x, y), confidence) cure reports
+# --------------------------------------------------------- #
+
+
+class RadioNetwork:
+    """
+    RadioNetwork delivers drone broadcasts within a radio range.
+
+    Parameters:
+    - radio_range (int): range of every radio, in cells
+    """
+
+    def __init__(self, radio_range):
+        if radio_range < 1:
+            raise ValueError(f"radio_range must be >= 1, got {radio_range}.")
+        self.radio_range = radio_range
+        self.hash = SpatialHash(radio_range)
+        self.radios = {}        # {agent_id: Radio}
+        self.messages = 0       # messages broadcast so far
+        self.deliveries = 0     # inbox deliveries so far
+
+    def register(self, agent_id, radio):
+        self.radios[agent_id] = radio
+
+    def unregister(self, agent_id):
+        self.radios.pop(agent_id, None)
+        self.hash.remove(agent_id)
+
+    def broadcast(self, message):
+        """Move the sender to its position and deliver the message around it."""
+        sender, position = message["sender"], message["position"]
+        self.hash.move(sender, position)
+        self.messages += 1
+
+        radios = self.radios
+        for agent_id, _ in self.hash.neighbors(position, self.radio_range):
+            if agent_id != sender:
+                radios[agent_id].inbox.append(message)
+                self.deliveries += 1
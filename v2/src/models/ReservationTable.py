@@ -0,0 +1,167 @@
+# --------------------------------------------------------- #
+# --- Model : ReservationTable.py ------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Space-time reservation table for the drone moves of one tick.
+# Every drone proposes its next cell; resolve() decides all the
+# moves at once, independently of the activation order:
+#
+# - Same-cell contention: the drone with the highest priority
+#   (charging trips, then missions, then exploration, then the
+#   lowest id) gets the cell.
+# - A cell held by a drone that stays cannot be entered.
+# - Chains (A moves into the cell B is leaving) are allowed when
+#   B's own move succeeds; rotations of 3+ drones move together.
+# - Swaps (A and B exchanging cells) are refused: the two drones
+#   would cross each other.
+# - Drones that lost their cell fall back to the free neighbour
+#   closest to the one they wanted instead of standing still.
+#
+# Every drone is visited a bounded number of times, so a tick
+# costs O(D) for D proposals.
+#
+# Methods:
+# - propose(drone, pos): register the wanted cell of a drone
+# - resolve(occupancy): {drone: cell} for every proposing drone
+# --------------------------------------------------------- #
+
+# Lower rank moves first on contention
+STATE_PRIORITY = {
+    "going_to_charging_station": 0,
+    "moving_to_target": 1,
+    "exploring": 2,
+}
+
+NEIGHBORHOOD = tuple(
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if not (dx == 0 and dy == 0)
+)
+
+
+def _priority(drone):
+    return (STATE_PRIORITY.get(drone.state, len(STATE_PRIORITY)), drone.unique_id)
+
+
+class ReservationTable:
+    """
+    ReservationTable resolves the proposed moves of one tick.
+
+    Parameters:
+    - width, height (int): grid size
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.proposals = {}     # {drone: (x, y)}, in proposal order
+
+    def __len__(self):
+        return len(self.proposals)
+
+    def in_bounds(self, pos):
+        x, y = pos
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def propose(self, drone, pos):
+        self.proposals[drone] = pos
+
+    def resolve(self, occupancy):
+        """
+        Decide every proposed move and clear the proposals.
+
+        Parameters:
+        - occupancy: current drone cells, supports `pos in occupancy`
+
+        Returns:
+        - dict {drone: (x, y)} with the cell every proposing drone goes
+          to (its own cell if it has to wait). Proposals Rotors refuses
+          (out of the grid, empty battery) are returned unchanged.
+        """
+        proposals, self.proposals = self.proposals, {}
+        resolved = {}
+        movers = {}
+        for drone, pos in proposals.items():
+            if pos == drone.pos or not self.in_bounds(pos) or drone.battery.get_level() <= 0:
+                resolved[drone] = pos
+            else:
+                movers[drone] = pos
+
+        # 1. Same-cell contention: one winner per wanted cell
+        claims = {}             # {cell: drone}
+        for drone, pos in movers.items():
+            holder = claims.get(pos)
+            if holder is None or _priority(drone) < _priority(holder):
+                claims[pos] = drone
+
+        # 2. Chains, rotations and swaps: a winner moves if its cell is
+        # free or the drone on it successfully moves away
+        leaving = {drone.pos: drone for drone in movers}
+        decided = {}            # {drone: bool}
+
+        for start in claims.values():
+            path = []
+            on_path = set()
+            drone = start
+            while True:
+                if drone in decided:
+                    result = decided[drone]
+                    break
+                if drone in on_path:
+                    # Rotation: everyone from the first repeat on moves
+                    cycle_start = path.index(drone)
+                    for member in path[cycle_start:]:
+                        decided[member] = True
+                    path = path[:cycle_start]
+                    result = True
+                    break
+
+                target = movers[drone]
+                if claims[target] is not drone:
+                    result = decided[drone] = False
+                    break
+
+                occupant = leaving.get(target)
+                if occupant is None:
+                    # Empty cell, or held by a drone that does not move
+                    result = decided[drone] = target not in occupancy
+                    break
+
+                if movers[occupant] == drone.pos:
+                    result = decided[drone] = decided[occupant] = False
+                    break
+
+                path.append(drone)
+                on_path.add(drone)
+                drone = occupant
+
+            # Everyone waiting on the chain shares its outcome
+            for member in path:
+                decided[member] = result
+
+        reserved = set()
+        blocked = []
+        for drone, pos in movers.items():
+            if decided.get(drone):
+                resolved[drone] = pos
+                reserved.add(pos)
+            else:
+                blocked.append(drone)
+
+        # 3. Fallback: blocked drones take the free neighbour closest to the
+        # cell they wanted, never a cell with a drone on it now, or stay
+        blocked.sort(key=_priority)
+        for drone in blocked:
+            wx, wy = movers[drone]
+            x, y = drone.pos
+            best, best_dist = drone.pos, None
+            for dx, dy in NEIGHBORHOOD:
+                cell = (x + dx, y + dy)
+                if not self.in_bounds(cell) or cell in reserved or cell in occupancy:
+                    continue
+                dist = max(abs(cell[0] - wx), abs(cell[1] - wy))
+                if best_dist is None or dist < best_dist:
+                    best, best_dist = cell, dist
+            if best_dist is not None:
+                reserved.add(best)
+            resolved[drone] = best
+
+        return resolved
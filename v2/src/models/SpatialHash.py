@@ -0,0 +1,87 @@
+# --------------------------------------------------------- #
+# --- Model : SpatialHash.py ------------------------------ #
+# --------------------------------------------------------- #
+# Description:
+# Spatial hash of moving points (the drones of the radio
+# network). Points live in square buckets of `cell_size` cells;
+# with cell_size equal to the query radius, a neighbour query
+# only visits the 3x3 buckets around the query position, so its
+# cost depends on the local density, not on the number of points.
+#
+# Distances are Chebyshev (square range), like the camera
+# footprint and the drone moves.
+#
+# Methods:
+# - move(key, pos): insert a point or update its position
+# - remove(key)
+# - neighbors(pos, radius): keys of the points within radius
+# --------------------------------------------------------- #
+
+
+class SpatialHash:
+    """
+    SpatialHash keeps {key: (x, y)} points in square buckets.
+
+    Parameters:
+    - cell_size (int): side of a bucket in cells
+    """
+
+    def __init__(self, cell_size):
+        if cell_size < 1:
+            raise ValueError(f"cell_size must be >= 1, got {cell_size}.")
+        self.cell_size = cell_size
+        self.buckets = {}       # {(bx, by): {key: (x, y)}}
+        self.positions = {}     # {key: (x, y)}
+
+    def _bucket_of(self, pos):
+        return (pos[0] // self.cell_size, pos[1] // self.cell_size)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, key):
+        return key in self.positions
+
+    # --- Updates ---
+    def move(self, key, pos):
+        old = self.positions.get(key)
+        if old == pos:
+            return
+
+        new_bucket = self._bucket_of(pos)
+        if old is not None:
+            old_bucket = self._bucket_of(old)
+            if old_bucket == new_bucket:
+                self.buckets[old_bucket][key] = pos
+                self.positions[key] = pos
+                return
+            self._discard(key, old_bucket)
+
+        self.buckets.setdefault(new_bucket, {})[key] = pos
+        self.positions[key] = pos
+
+    def remove(self, key):
+        old = self.positions.pop(key, None)
+        if old is not None:
+            self._discard(key, self._bucket_of(old))
+
+    def _discard(self, key, bucket_key):
+        bucket = self.buckets[bucket_key]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[bucket_key]
+
+    # --- Queries ---
+    def neighbors(self, pos, radius):
+        """Yield (key, position) of every point within `radius` of pos."""
+        x0, y0 = pos
+        reach = -(-radius // self.cell_size)    # buckets to visit per side
+        bx0, by0 = self._bucket_of(pos)
+        for bx in range(bx0 - reach, bx0 + reach + 1):
+            for by in range(by0 - reach, by0 + reach + 1):
+                bucket = self.buckets.get((bx, by))
+                if not bucket:
+                    continue
+                for key, (x, y) in bucket.items():
+                    if abs(x - x0) <= radius and abs(y - y0) <= radius:
+                        yield key, (x, y)
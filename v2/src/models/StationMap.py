@@ -0,0 +1,64 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import numpy as np
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : StationMap.py ------------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Per-cell nearest charging station (a Manhattan Voronoi
+# partition of the grid) and the distance to it. The maps are
+# built once from the station positions, which are fixed after
+# the model init, so finding the closest station becomes a
+# constant-time lookup instead of a loop over every station.
+#
+# Ties go to the first station in the given order, the same
+# choice as Controller.get_closest_charging_station.
+#
+# Methods:
+# - build(stations): (re)build the maps
+# - nearest(pos): (station_pos, distance)
+# --------------------------------------------------------- #
+
+
+class StationMap:
+    """
+    StationMap keeps the label and distance maps of the nearest station.
+
+    Parameters:
+    - width, height (int): grid size
+
+    Attributes:
+    - stations (list): station positions, indexed by the labels
+    - labels (np.ndarray): int32 [x, y] index of the nearest station, -1 if none
+    - distance (np.ndarray): int32 [x, y] Manhattan distance to it
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.stations = []
+        self.labels = np.full((width, height), -1, dtype=np.int32)
+        self.distance = np.full((width, height), np.iinfo(np.int32).max, dtype=np.int32)
+
+    def build(self, stations):
+        self.stations = list(stations)
+        self.labels.fill(-1)
+        self.distance.fill(np.iinfo(np.int32).max)
+
+        xs = np.arange(self.width, dtype=np.int32)[:, None]
+        ys = np.arange(self.height, dtype=np.int32)[None, :]
+        for i, (sx, sy) in enumerate(self.stations):
+            dist = np.abs(xs - sx) + np.abs(ys - sy)
+            closer = dist < self.distance        # strict: earlier stations win ties
+            self.labels[closer] = i
+            self.distance[closer] = dist[closer]
+
+    def nearest(self, pos):
+        """(station_pos, distance) of the station closest to pos, or (None, inf)."""
+        label = self.labels[pos]
+        if label < 0:
+            return None, float("inf")
+        return self.stations[label], int(self.distance[pos])
@@ -0,0 +1,199 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import numpy as np
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : TargetAllocator.py -------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Fleet-wide target allocation, computed once per tick by the
+# model instead of every drone picking its own closest target.
+# Drones and targets are matched one-to-one over a Manhattan
+# distance matrix, so two drones never chase the same palm
+# while another one has nothing to do.
+#
+# Methods:
+# - "greedy": repeatedly match the closest free (drone, target)
+#   pair. Fast, not always optimal.
+# - "auction": Bertsekas auction with epsilon scaling, which
+#   minimizes the total distance travelled by the fleet.
+# --------------------------------------------------------- #
+
+ALLOCATION_METHODS = ("greedy", "auction")
+
+
+def distance_matrix(sources, targets):
+    """Manhattan distances, shape (len(sources), len(targets))."""
+    sources = np.asarray(sources, dtype=np.int64).reshape(-1, 2)
+    targets = np.asarray(targets, dtype=np.int64).reshape(-1, 2)
+    return np.abs(sources[:, None, :] - targets[None, :, :]).sum(axis=2)
+
+
+class TargetAllocator:
+    """
+    TargetAllocator assigns at most one target to every drone.
+
+    Parameters:
+    - method (str): "greedy" or "auction"
+    """
+
+    def __init__(self, method="greedy"):
+        if method not in ALLOCATION_METHODS:
+            raise ValueError(f"Unknown allocation method '{method}', expected one of {ALLOCATION_METHODS}.")
+        self.method = method
+
+    def allocate(self, drones_positions, targets):
+        """
+        Match drones to targets.
+
+        Parameters:
+        - drones_positions (dict): {drone_id: (x, y)} of the available drones
+        - targets (list): target positions [(x, y), ...]
+
+        Returns:
+        - dict: {drone_id: (x, y)}, drones left without a target are omitted
+        """
+        if not drones_positions or not targets:
+            return {}
+
+        drone_ids = list(drones_positions)
+        cost = distance_matrix([drones_positions[i] for i in drone_ids], targets)
+
+        if self.method == "greedy":
+            rows, cols = _greedy(cost)
+        else:
+            rows, cols = _auction(cost)
+
+        return {drone_ids[r]: targets[c] for r, c in zip(rows, cols)}
+
+
+def _greedy(cost):
+    """Closest pairs first; ties keep drone order, then target order."""
+    n_rows, n_cols = cost.shape
+    order = np.argsort(cost, axis=None, kind="stable")
+
+    row_used = np.zeros(n_rows, dtype=bool)
+    col_used = np.zeros(n_cols, dtype=bool)
+    rows, cols = [], []
+    for flat in order:
+        r, c = divmod(int(flat), n_cols)
+        if row_used[r] or col_used[c]:
+            continue
+        row_used[r] = col_used[c] = True
+        rows.append(r)
+        cols.append(c)
+        if len(rows) == min(n_rows, n_cols):
+            break
+    return rows, cols
+
+
+def _auction(cost):
+    """
+    Minimum-cost one-to-one matching of an integer cost matrix.
+    The side with fewer elements bids for the other one.
+    """
+    if cost.shape[0] > cost.shape[1]:
+        cols, rows = _auction(cost.T)
+        return rows, cols
+
+    # Some optimal matching only uses the n_rows closest columns of every
+    # row (a row matched further away can swap to one of them that is
+    # free), so the other columns never need to be bid for
+    n_rows, n_cols = cost.shape
+    candidates = np.arange(n_cols)
+    if n_cols > n_rows * n_rows:
+        nearest = np.argpartition(cost, n_rows - 1, axis=1)[:, :n_rows]
+        candidates = np.unique(nearest)
+        cost = cost[:, candidates]
+        n_cols = len(candidates)
+
+    benefit = -cost.astype(np.float64)
+    prices = np.zeros(n_cols)
+
+    # Epsilon scaling: coarse rounds settle the prices quickly, the last
+    # round (eps < 1/n_rows) is optimal for integer costs
+    eps_final = 1.0 / (n_rows + 1)
+    eps = max(float(cost.max()) / 4.0, eps_final)
+    while True:
+        assignment = _auction_round(benefit, prices, eps)
+        if eps <= eps_final:
+            break
+        eps = max(eps / 4.0, eps_final)
+
+    return list(range(n_rows)), [int(candidates[c]) for c in assignment]
+
+
+def _auction_round(benefit, prices, eps):
+    """
+    One asymmetric auction with fixed eps (rows <= columns); updates prices
+    in place. Only the rows bid (forward phase); then the free columns
+    priced above the cheapest taken column bid for rows (reverse phase),
+    so prices carried over from the previous round cannot leave the
+    matching suboptimal.
+    """
+    n_rows, n_cols = benefit.shape
+    assignment = np.full(n_rows, -1, dtype=np.int64)
+    owner = np.full(n_cols, -1, dtype=np.int64)
+
+    # Forward: every row bids for its best column
+    unassigned = list(range(n_rows - 1, -1, -1))
+    while unassigned:
+        r = unassigned.pop()
+        values = benefit[r] - prices
+
+        best = int(np.argmax(values))
+        if n_cols > 1:
+            best_value = values[best]
+            values[best] = -np.inf
+            second_value = values.max()
+        else:
+            best_value, second_value = values[best], values[best]
+
+        prices[best] += best_value - second_value + eps
+
+        previous = owner[best]
+        if previous >= 0:
+            assignment[previous] = -1
+            unassigned.append(int(previous))
+        owner[best] = r
+        assignment[r] = best
+
+    if n_cols == n_rows:
+        return assignment
+
+    # Reverse: free columns must not be priced above the taken ones
+    rows = np.arange(n_rows)
+    profits = benefit[rows, assignment] - prices[assignment]
+    floor = prices[assignment].min()
+    pending = [c for c in np.flatnonzero(owner < 0).tolist() if prices[c] > floor]
+
+    while pending:
+        c = pending.pop()
+        values = benefit[:, c] - profits
+
+        best = int(np.argmax(values))
+        best_value = values[best]
+        if n_rows > 1:
+            values[best] = -np.inf
+            second_value = values.max()
+        else:
+            second_value = -np.inf
+
+        if floor >= best_value - eps:
+            prices[c] = floor
+            continue
+
+        delta = min(best_value - floor, best_value - second_value + eps)
+        prices[c] = best_value - delta
+        profits[best] += delta
+
+        released = int(assignment[best])
+        owner[released] = -1
+        owner[c] = best
+        assignment[best] = c
+        if prices[released] > floor:
+            pending.append(released)
+
+    return assignment
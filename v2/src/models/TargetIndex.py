@@ -0,0 +1,124 @@
+# --------------------------------------------------------- #
+# --- Model : TargetIndex.py ------------------------------ #
+# --------------------------------------------------------- #
+# Description:
+# Bucket-grid spatial index over the palm targets of the
+# blackboard. Targets are added and removed as the blackboard
+# changes, and nearest-target queries only visit the buckets
+# around the query position.
+#
+# Distances are Manhattan, like Controller.manhattan_distance.
+# Ties are broken by insertion order, which matches the stable
+# sort over the blackboard dict that the controller used before.
+#
+# Methods:
+# - add(pos), remove(pos), __contains__, __len__, __iter__
+# - intersection(positions): the given positions that are targets
+# - nearest(pos): closest target position, or None
+# --------------------------------------------------------- #
+
+
+class TargetIndex:
+    """
+    TargetIndex keeps target positions in square buckets of
+    `bucket_size` cells.
+
+    Parameters:
+    - width, height (int): grid size
+    - bucket_size (int): side of a bucket in cells
+    """
+
+    def __init__(self, width, height, bucket_size=8):
+        self.width = width
+        self.height = height
+        self.bucket_size = bucket_size
+        self.n_buckets_x = (width + bucket_size - 1) // bucket_size
+        self.n_buckets_y = (height + bucket_size - 1) // bucket_size
+
+        self.buckets = {}       # {(bx, by): {pos: seq}}
+        self._seq = {}          # {pos: insertion sequence number}
+        self._next_seq = 0
+
+    def _bucket_of(self, pos):
+        return (pos[0] // self.bucket_size, pos[1] // self.bucket_size)
+
+    # --- Updates ---
+    def add(self, pos):
+        if pos in self._seq:
+            return
+        seq = self._next_seq
+        self._next_seq += 1
+        self._seq[pos] = seq
+        self.buckets.setdefault(self._bucket_of(pos), {})[pos] = seq
+
+    def remove(self, pos):
+        if self._seq.pop(pos, None) is None:
+            return
+        key = self._bucket_of(pos)
+        bucket = self.buckets[key]
+        del bucket[pos]
+        if not bucket:
+            del self.buckets[key]
+
+    # --- Queries ---
+    def __contains__(self, pos):
+        return pos in self._seq
+
+    def __len__(self):
+        return len(self._seq)
+
+    def __iter__(self):
+        return iter(self._seq)
+
+    def intersection(self, positions):
+        """Set of the given (x, y) positions that are targets."""
+        return self._seq.keys() & positions
+
+    def nearest(self, pos):
+        """
+        Return the target closest to pos (Manhattan), the earliest added
+        one on ties, or None if the index is empty.
+        """
+        if not self._seq:
+            return None
+
+        x0, y0 = pos
+        bx0, by0 = self._bucket_of(pos)
+        size = self.bucket_size
+        max_ring = max(bx0, self.n_buckets_x - 1 - bx0, by0, self.n_buckets_y - 1 - by0)
+
+        best, best_dist, best_seq = None, None, None
+        for ring in range(max_ring + 1):
+            # Every cell of a bucket in this ring is at least this far away
+            if best is not None and (ring - 1) * size + 1 > best_dist:
+                break
+
+            for key in self._ring(bx0, by0, ring):
+                bucket = self.buckets.get(key)
+                if not bucket:
+                    continue
+                for target, seq in bucket.items():
+                    dist = abs(target[0] - x0) + abs(target[1] - y0)
+                    if best is None or dist < best_dist or (dist == best_dist and seq < best_seq):
+                        best, best_dist, best_seq = target, dist, seq
+
+        return best
+
+    def _ring(self, bx0, by0, ring):
+        """Yield the in-range bucket keys at Chebyshev distance `ring`."""
+        if ring == 0:
+            yield (bx0, by0)
+            return
+
+        x_min, x_max = bx0 - ring, bx0 + ring
+        y_min, y_max = by0 - ring, by0 + ring
+        for bx in range(max(x_min, 0), min(x_max, self.n_buckets_x - 1) + 1):
+            if y_min >= 0:
+                yield (bx, y_min)
+            if y_max < self.n_buckets_y:
+                yield (bx, y_max)
+        for by in range(max(y_min + 1, 0), min(y_max - 1, self.n_buckets_y - 1) + 1):
+            if x_min >= 0:
+                yield (x_min, by)
+            if x_max < self.n_buckets_x:
+                yield (x_max, by)
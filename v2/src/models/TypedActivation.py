@@ -0,0 +1,83 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+from collections import defaultdict
+from mesa.time import RandomActivation
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Scheduler : TypedActivation.py ---------------------- #
+# --------------------------------------------------------- #
+# Description:
+# RandomActivation that keeps agents grouped by type and only
+# steps the ones that can still act:
+# - Static agent types (cells, charging stations) are tracked
+#   but never activated.
+# - Agents exposing `is_terminal == True` (e.g. dead palms) are
+#   dropped from the active set the first time it is observed.
+#
+# The remaining active agents are shuffled together with the
+# model RNG every step, as RandomActivation does.
+# --------------------------------------------------------- #
+
+
+class TypedActivation(RandomActivation):
+    """
+    Scheduler with per-type agent sets and an active set.
+
+    Parameters:
+    - model: the Mesa model
+    - static_types (tuple): agent classes that never need to step
+    """
+
+    def __init__(self, model, static_types=()):
+        super().__init__(model)
+        self.static_types = tuple(static_types)
+        self.agents_by_type = defaultdict(dict)   # {type: {unique_id: agent}}
+        self._active = {}                         # {unique_id: agent}
+
+    def add(self, agent):
+        super().add(agent)
+        self.agents_by_type[type(agent)][agent.unique_id] = agent
+        if not isinstance(agent, self.static_types):
+            self._active[agent.unique_id] = agent
+
+    def remove(self, agent):
+        super().remove(agent)
+        del self.agents_by_type[type(agent)][agent.unique_id]
+        self._active.pop(agent.unique_id, None)
+
+    def deactivate(self, agent):
+        """Stop activating an agent, keeping it in the schedule."""
+        self._active.pop(agent.unique_id, None)
+
+    def agents_of_type(self, agent_type):
+        return list(self.agents_by_type[agent_type].values())
+
+    def get_type_count(self, agent_type):
+        return len(self.agents_by_type[agent_type])
+
+    def get_active_count(self):
+        return len(self._active)
+
+    def step(self):
+        """Step every active agent once, in random order."""
+        agent_keys = list(self._active.keys())
+        self.model.random.shuffle(agent_keys)
+
+        for agent_key in agent_keys:
+            agent = self._active.get(agent_key)
+            if agent is None:
+                continue
+
+            if getattr(agent, "is_terminal", False):
+                self.deactivate(agent)
+                continue
+
+            agent.step()
+
+            if getattr(agent, "is_terminal", False):
+                self.deactivate(agent)
+
+        self.steps += 1
+        self.time += 1
@@ -0,0 +1,77 @@
+# --------------------------------------------------------- #
+# --- Model : VisibilityTracker.py ------------------------ #
+# --------------------------------------------------------- #
+# Description:
+# Keeps the `visible` layer of the WorldState up to date as
+# drones move. Only the cells that enter or leave a drone
+# footprint are touched, and the number of visible cells is
+# maintained incrementally, so coverage is an O(1) read.
+#
+# Attributes:
+# - world: WorldState whose `visible` counters are updated
+# - radius (int): footprint radius around the drone (1 -> 3x3)
+# - footprints (dict): {drone_id: (x, y)} last applied position
+# - visible_count (int): number of cells seen by at least one drone
+#
+# Methods:
+# - move(drone_id, position): apply the footprint delta of a drone
+# - coverage(): fraction of the grid currently visible
+# --------------------------------------------------------- #
+
+
+class VisibilityTracker:
+    """
+    VisibilityTracker maintains per-cell drone visibility counters.
+
+    When a drone moves from `old` to `new`, cells only in the old
+    footprint are decremented and cells only in the new footprint are
+    incremented. The per-move cost depends on the footprint size, not on
+    the grid area.
+    """
+
+    def __init__(self, world, radius=1):
+        self.world = world
+        self.radius = radius
+        self.footprints = {}
+        self.visible_count = 0
+
+    def footprint(self, position):
+        """Return the set of in-bounds cells seen from position."""
+        x0, y0 = position
+        r = self.radius
+        return {
+            (x, y)
+            for x in range(max(x0 - r, 0), min(x0 + r + 1, self.world.width))
+            for y in range(max(y0 - r, 0), min(y0 + r + 1, self.world.height))
+        }
+
+    def move(self, drone_id, position):
+        old = self.footprints.get(drone_id)
+        if old == position:
+            return
+
+        old_cells = self.footprint(old) if old is not None else set()
+        new_cells = self.footprint(position)
+
+        for cell in old_cells - new_cells:
+            self._unmark(cell)
+        for cell in new_cells - old_cells:
+            self._mark(cell)
+
+        self.footprints[drone_id] = position
+
+    def coverage(self):
+        total = self.world.width * self.world.height
+        return self.visible_count / total if total > 0 else 0
+
+    def _mark(self, cell):
+        visible = self.world.visible
+        if visible[cell] == 0:
+            self.visible_count += 1
+        visible[cell] += 1
+
+    def _unmark(self, cell):
+        visible = self.world.visible
+        visible[cell] -= 1
+        if visible[cell] == 0:
+            self.visible_count -= 1
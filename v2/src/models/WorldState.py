@@ -0,0 +1,272 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import numpy as np
+
+from src.agents.PalmAgent import PalmAgent
+from src.models.PopulationCounters import PopulationCounters
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Model : WorldState.py ------------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Array-backed storage for the per-cell state of the farm.
+# Every layer is a NumPy array indexed as [x, y], the same
+# coordinates used by the Mesa grid.
+#
+# Layers:
+# - cell_type (int8): terrain type, 0 means "can host a palm"
+# - palm_state (int8): PALM_NONE / VERDE / INFECTADA / MUERTA,
+#   the interior view of `palm_state_padded`, which has a border
+#   of `pad` PALM_NONE cells so camera footprints near the edges
+#   are plain slices
+# - palm_health (float32): palm health level (0–100)
+# - palm_version (uint32): bumped on every palm state or health
+#   change, padded like palm_state (see InferenceCache)
+# - visible (int16): number of drones currently seeing the cell
+# - targeted (int16): palm target marks from the blackboard
+#
+# Every palm state change is reported to `counters`.
+#
+# Methods:
+# - assign_cell_types(): random terrain, same rules as GridCellAgent
+# - place_palms(): random palm population for the array engine
+# - get/set_palm_state(), get/set_palm_health(): per cell access
+# - has_infected_neighbor(): infection check around one cell
+# - palm_state_footprint(), palm_version_footprint(): zero-copy
+#   views of the states / versions around a cell
+# - apply_medicine(): healing rules shared by both engines
+# - step_palms(): vectorized palm dynamics for the whole forest
+# --------------------------------------------------------- #
+
+# Palm state codes
+PALM_NONE = 0
+PALM_VERDE = 1
+PALM_INFECTADA = 2
+PALM_MUERTA = 3
+
+PALM_STATE_NAMES = (None, "verde", "infectada", "muerta")
+PALM_STATE_CODES = {name: code for code, name in enumerate(PALM_STATE_NAMES) if name}
+
+
+class WorldState:
+    """
+    WorldState keeps the cell layer of the simulation in NumPy arrays
+    owned by the model, so the memory cost is a few bytes per cell
+    instead of one Python object per cell.
+
+    With the "agents" engine, GridCellAgent and PalmAgent are thin
+    views over these arrays. With the "arrays" engine no cell or palm
+    agents exist at all, and drones, components and reporters read and
+    write the arrays directly.
+    """
+
+    def __init__(self, width, height, counters=None, pad=1):
+        if pad < 1:
+            raise ValueError("WorldState needs a padding of at least 1 cell.")
+
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.counters = counters if counters is not None else PopulationCounters()
+
+        shape = (width, height)
+        self.cell_type = np.zeros(shape, dtype=np.int8)
+        self.palm_state_padded = np.zeros((width + 2 * pad, height + 2 * pad), dtype=np.int8)
+        self.palm_state = self.palm_state_padded[pad:pad + width, pad:pad + height]
+        self.palm_health = np.zeros(shape, dtype=np.float32)
+        self.palm_version_padded = np.zeros(self.palm_state_padded.shape, dtype=np.uint32)
+        self.palm_version = self.palm_version_padded[pad:pad + width, pad:pad + height]
+        self.visible = np.zeros(shape, dtype=np.int16)
+        self.targeted = np.zeros(shape, dtype=np.int16)
+
+        self.counters.palms[PALM_NONE] += width * height
+
+    # --- Grid helpers ---
+    def in_bounds(self, pos):
+        x, y = pos
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    # --- Population ---
+    def assign_cell_types(self, rng):
+        """Vectorized version of GridCellAgent._assign_type for every cell."""
+        shape = self.cell_type.shape
+        special = rng.random(shape) >= 0.95
+        common_special = rng.random(shape) < 0.95
+
+        types = np.where(
+            common_special,
+            rng.integers(0, 6, size=shape),
+            rng.integers(6, 8, size=shape)
+        )
+        self.cell_type[:] = np.where(special, types, 0)
+
+    def place_palms(self, rng, densidad, blocked_positions=()):
+        """
+        Randomly populate palms on cells that can host them, skipping
+        blocked positions (charging stations and drones).
+        """
+        shape = self.palm_state.shape
+        can_host = self.cell_type == 0
+        for x, y in blocked_positions:
+            can_host[x, y] = False
+
+        has_palm = can_host & (rng.random(shape) < densidad)
+        infected = has_palm & (rng.random(shape) < 0.1)
+
+        old = self.palm_state[has_palm]
+        self.palm_state[has_palm] = PALM_VERDE
+        self.palm_state[infected] = PALM_INFECTADA
+        self.palm_health[has_palm] = 100
+        self.palm_version[has_palm] += 1
+
+        self.counters.palm_transitions(old, self.palm_state[has_palm])
+
+    def place_palm(self, pos, estado="verde"):
+        self._set_code(pos, PALM_STATE_CODES[estado])
+        self.set_palm_health(pos, 100)
+
+    # --- Per cell access ---
+    def has_palm(self, pos):
+        return self.palm_state[pos] != PALM_NONE
+
+    def get_palm_state(self, pos):
+        """Return the palm state name at pos, or None if there is no palm."""
+        return PALM_STATE_NAMES[self.palm_state[pos]]
+
+    def palm_state_footprint(self, pos, radius=1):
+        """
+        Read-only view of the palm state codes in the (2r+1)x(2r+1)
+        square around pos, indexed [dy, dx] like the camera photos.
+        Cells outside the grid read as PALM_NONE. The view shares memory
+        with the world, so it reflects later state changes.
+        """
+        return self._footprint(self.palm_state_padded, pos, radius)
+
+    def palm_version_footprint(self, pos, radius=1):
+        """Same as palm_state_footprint(), for the palm versions."""
+        return self._footprint(self.palm_version_padded, pos, radius)
+
+    def _footprint(self, padded, pos, radius):
+        if radius > self.pad:
+            raise ValueError(f"Footprint radius {radius} is larger than the world padding {self.pad}.")
+
+        x, y = pos[0] + self.pad, pos[1] + self.pad
+        view = padded[x - radius:x + radius + 1, y - radius:y + radius + 1].T
+        view.flags.writeable = False
+        return view
+
+    def has_infected_neighbor(self, pos):
+        """True if an infected palm is in the 3x3 square around pos (pos included)."""
+        x, y = pos[0] + self.pad, pos[1] + self.pad
+        return bool((self.palm_state_padded[x - 1:x + 2, y - 1:y + 2] == PALM_INFECTADA).any())
+
+    def set_palm_state(self, pos, estado):
+        self._set_code(pos, PALM_STATE_CODES[estado])
+
+    def _set_code(self, pos, code):
+        old = self.palm_state[pos]
+        if old != code:
+            self.palm_state[pos] = code
+            self.palm_version[pos] += 1
+            self.counters.palm_transition(old, code)
+
+    def get_palm_health(self, pos):
+        """Return the palm health at pos, or None if there is no palm."""
+        if self.palm_state[pos] == PALM_NONE:
+            return None
+        return float(self.palm_health[pos])
+
+    def set_palm_health(self, pos, value):
+        if self.palm_health[pos] != np.float32(value):
+            self.palm_version[pos] += 1
+        self.palm_health[pos] = value
+
+    # --- Counters ---
+    def count_palms(self):
+        return self.counters.count_palms()
+
+    def count_state(self, estado):
+        code = PALM_STATE_CODES.get(estado)
+        if code is None:
+            return 0
+        return self.counters.count_palm_state(code)
+
+    # --- Palm rules ---
+    def apply_medicine(self, pos, amount):
+        """
+        Increase the health of an infected palm and update its state.
+        Same rules as PalmAgent.apply_medicine.
+        """
+        if self.palm_state[pos] != PALM_INFECTADA:
+            return
+
+        health = min(max(float(self.palm_health[pos]) + amount, 0), 100)
+
+        if health > PalmAgent.HEALTH_UMBRAL_MAX:
+            self._set_code(pos, PALM_VERDE)
+            health = 100
+        elif health <= PalmAgent.HEALTH_UMBRAL_MIN:
+            self._set_code(pos, PALM_MUERTA)
+            health = 0
+
+        self.set_palm_health(pos, health)
+
+    def count_infected_neighbors(self):
+        """
+        Number of infected palms in the Moore neighborhood of every cell,
+        computed as a 3x3 convolution over the padded infected mask.
+        """
+        p = self.pad
+        infected = (self.palm_state_padded[p - 1:p + self.width + 1, p - 1:p + self.height + 1]
+                    == PALM_INFECTADA).view(np.int8)
+
+        counts = np.zeros((self.width, self.height), dtype=np.int8)
+        for dx in (0, 1, 2):
+            for dy in (0, 1, 2):
+                if dx == 1 and dy == 1:
+                    continue
+                counts += infected[dx:dx + self.width, dy:dy + self.height]
+        return counts
+
+    def step_palms(self, tasa_propagacion, rng):
+        """
+        Vectorized palm dynamics: one synchronous pass over the whole
+        forest with the same rules as PalmAgent.step.
+
+        - Healthy palms with k infected neighbors get infected with
+          probability 1 - (1 - tasa_propagacion)^k.
+        - Healthy palms not infected by neighbors can auto-infect.
+        - Palms infected at the start of the tick degrade and may die.
+        """
+        state = self.palm_state
+        healthy = state == PALM_VERDE
+        infected = state == PALM_INFECTADA
+
+        # Infection by neighbors
+        k = self.count_infected_neighbors()
+        p_infection = 1.0 - (1.0 - tasa_propagacion) ** k
+        by_neighbors = healthy & (rng.random(state.shape) < p_infection)
+
+        # Auto-infection
+        auto = healthy & ~by_neighbors & (rng.random(state.shape) < PalmAgent.AUTO_INFECTED_PROBABILITY)
+
+        # Health degradation and death of already infected palms
+        n_infected = int(np.count_nonzero(infected))
+        if n_infected:
+            rate = PalmAgent.INFECTED_HEALTH_RATE
+            variation = rate * (rng.random(n_infected) - rng.random(n_infected))
+            health = self.palm_health[infected] - (rate + variation)
+
+            dead = health <= PalmAgent.HEALTH_UMBRAL_MIN
+            health[dead] = PalmAgent.HEALTH_UMBRAL_MIN
+            self.palm_health[infected] = health
+            self.palm_version[infected] += 1
+            state[infected] = np.where(dead, PALM_MUERTA, PALM_INFECTADA)
+            self.counters.palm_transition(PALM_INFECTADA, PALM_MUERTA, int(np.count_nonzero(dead)))
+
+        new_infected = by_neighbors | auto
+        state[new_infected] = PALM_INFECTADA
+        self.palm_version[new_infected] += 1
+        self.counters.palm_transition(PALM_VERDE, PALM_INFECTADA, int(np.count_nonzero(new_infected)))
@@ -1,10 +1,12 @@
 # --------------------------------------------------------- #
 # --- Imports --------------------------------------------- #
 # --------------------------------------------------------- #
+import os
 import random
+import numpy as np
+from types import MappingProxyType
 from mesa import Model
 from mesa.space import MultiGrid
-from mesa.time import RandomActivation
 from mesa.datacollection import DataCollector
 # --------------------------------------------------------- #
 
@@ -18,8 +20,46 @@ from src.agents.ChargingStationAgent import ChargingStationAgent
 
 # Visualization Angets
 from src.visualization.GridCellAgent import GridCellAgent
+
+# World State
+from src.models.WorldState import WorldState
+from src.models.VisibilityTracker import VisibilityTracker
+from src.models.Blackboard import Blackboard
+from src.models.BlackboardWriteBuffer import BlackboardWriteBuffer
+from src.models.TargetIndex import TargetIndex
+from src.models.TargetAllocator import TargetAllocator
+from src.models.NavigationFields import NavigationFields
+from src.models.StationMap import StationMap
+from src.models.DroneOccupancy import DroneOccupancy
+from src.models.ReservationTable import ReservationTable
+from src.models.RadioNetwork import RadioNetwork
+from src.models.InferenceQueue import InferenceQueue
+from src.models.InferenceCache import InferenceCache
+from src.agents.components.CVBackends import RandomCVBackend
+from src.models.PopulationCounters import PopulationCounters
+from src.models.TypedActivation import TypedActivation
+from src.models.EventActivation import EventActivation
+from src.models.AgentRecorder import AgentRecorder
+from src.utils.ResultWriter import ChunkedResultWriter
+from src.utils.PhaseTimers import PhaseTimers
 # --------------------------------------------------------- #
 
+ENGINES = ("agents", "arrays")
+PALM_DYNAMICS = ("agents", "vectorized")
+MOVE_RESOLUTIONS = ("sequential", "reservation")
+ACTIVATIONS = ("every_tick", "event")
+
+# Model methods timed when profile=True
+BLACKBOARD_MUTATORS = (
+    "update_blackboard_drone_positions",
+    "update_blackboard_palms_targets",
+    "update_blackboard_detections",
+    "report_palm_cured",
+    "allocate_targets",
+    "commit_blackboard_writes",
+    "resolve_moves",
+)
+
 class PalmerasModel(Model):
     """
     Multi-agent simulation model for monitoring and controlling disease spread 
@@ -29,11 +69,103 @@ class PalmerasModel(Model):
     where each cell can contain palm trees, drones, or ground sensors.
     Drones move around to detect infected palms, update a shared blackboard,
     and coordinate actions to maximize forest health.
+
+    The per-cell state (palms, terrain, visibility, targets) lives in the
+    `world` arrays. With engine="agents" every cell and palm also gets a
+    Mesa agent (needed by the web visualization); with engine="arrays"
+    only drones and charging stations are agents and palms are updated
+    directly on the arrays.
+
+    `palm_dynamics` selects how palms evolve: "agents" steps every
+    PalmAgent from the schedule, "vectorized" updates the whole forest
+    in one batched pass per tick (always used by the arrays engine).
+
+    If `results_dir` is given, collected data is streamed to that folder
+    every `chunk_size` steps (see ChunkedResultWriter) and dropped from
+    memory; call close_results() at the end of the run.
+
+    `seed` makes a run reproducible: it seeds the Mesa model RNG (used by
+    the scheduler) and the `random` module used by the agents.
+
+    `camera_radius` is the drone camera footprint radius (1 -> 3x3); the
+    world arrays are padded by it so photos are zero-copy views.
+
+    With `profile=True` the drone phases and the blackboard mutators are
+    timed every tick (see `self.timers`); with profile=False nothing is
+    instrumented.
+
+    `target_allocation` ("greedy" or "auction") makes the model assign
+    targets to the whole fleet once per tick (see TargetAllocator); the
+    drones then follow their assignment from the blackboard instead of
+    each one picking the closest target. None keeps the per-drone choice.
+
+    `cv_backend` is the classifier behind the drone cameras (a CVBackend,
+    RandomCVBackend by default). With `batch_inference=True` drones are
+    stepped in stages: every drone senses and queues its photo, the model
+    runs one batched inference for the whole fleet, then every drone
+    runs control, action and output communication.
+
+    With `cv_cache=True` the CV result of every cell is kept in an
+    InferenceCache, so cells whose palm did not change since they were
+    last photographed are not analyzed again.
+
+    With `buffered_blackboard=True` the blackboard is double-buffered:
+    drone writes (positions, detections, cure reports) are queued during
+    the tick and committed in one merge pass at the end of step(), so
+    every drone reads the same state, the one of the previous tick.
+
+    `move_resolution` selects how drone collisions are avoided.
+    "sequential" lets every drone dodge the drones that moved before it
+    in the tick. "reservation" steps the drones in stages: every drone
+    plans its move against the positions at the start of the tick, a
+    ReservationTable resolves contention, chains and swaps for the whole
+    fleet in one pass, and the resolved moves are applied together, so
+    the result does not depend on the activation order.
+
+    With a `radio_range` (in cells) the drones stop reading the global
+    blackboard: every tick each drone broadcasts its position, detections
+    and cure reports to the drones within range (see RadioNetwork), and
+    plans with the targets and drones it heard of. The blackboard is
+    still written, for the metrics. None keeps the global blackboard.
+
+    `activation` selects the scheduler. "every_tick" steps every agent
+    every tick. "event" lets quiescent agents sleep (see EventActivation):
+    healthy PalmAgents with no infected neighbour until a neighbour gets
+    infected or their pre-drawn auto-infection tick, charging drones
+    until their charge is complete (the recharges are applied when they
+    wake). Sleeping drones do not sense or publish, so the tick cost
+    follows the number of active agents.
     """
-    def __init__(self, width, height, densidad, n_drones, tasa_propagacion, tasa_cura):
-        
+    def __init__(self, width, height, densidad, n_drones, tasa_propagacion, tasa_cura,
+                 engine="agents", palm_dynamics=None, results_dir=None, chunk_size=1000, seed=None,
+                 profile=False, target_allocation=None, camera_radius=1, cv_backend=None,
+                 batch_inference=False, cv_cache=False, buffered_blackboard=False,
+                 move_resolution="sequential", radio_range=None, activation="every_tick"):
+
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}.")
+
+        if palm_dynamics is None:
+            palm_dynamics = "vectorized" if engine == "arrays" else "agents"
+        if palm_dynamics not in PALM_DYNAMICS:
+            raise ValueError(f"Unknown palm_dynamics '{palm_dynamics}', expected one of {PALM_DYNAMICS}.")
+        if engine == "arrays" and palm_dynamics == "agents":
+            raise ValueError("The arrays engine has no PalmAgents, use palm_dynamics='vectorized'.")
+        if move_resolution not in MOVE_RESOLUTIONS:
+            raise ValueError(f"Unknown move_resolution '{move_resolution}', expected one of {MOVE_RESOLUTIONS}.")
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"Unknown activation '{activation}', expected one of {ACTIVATIONS}.")
+        if radio_range is not None and target_allocation is not None:
+            raise ValueError("target_allocation assigns targets from the global blackboard, it needs radio_range=None.")
+
+        # Model (Random) Parameters, self.random is seeded by Mesa from `seed`
+        if seed is not None:
+            random.seed(seed)
+
         # Model (Mesa) Parameters
-        self.schedule = RandomActivation(self)
+        self.event_activation = activation == "event"
+        scheduler = EventActivation if self.event_activation else TypedActivation
+        self.schedule = scheduler(self, static_types=(GridCellAgent, ChargingStationAgent))
         self.grid = MultiGrid(width, height, torus=False)
         self.running = True
         self.current_id = 0
@@ -46,22 +178,16 @@ class PalmerasModel(Model):
                 "Step": lambda m: m.schedule.time,
 
                 # Palmas
-                "PalmasTotales": lambda m: sum(isinstance(a, PalmAgent) for a in m.schedule.agents),
+                "PalmasTotales": lambda m: m.world.count_palms(),
                 "PalmasInfectadas": self.count_palmas_infectadas,
                 "PalmasSanas": self.count_palmas_curadas,
-                "PalmasQuemadas": lambda m: sum(
-                    1 for a in m.schedule.agents if isinstance(a, PalmAgent) and a.estado == "quemada"
-                ),
+                "PalmasQuemadas": lambda m: m.world.count_state("quemada"),
                 "PalmasDetectadas": lambda m: len(m.blackboard["palms_targets"]),
 
                 # Drones
                 "DronesTotales": lambda m: m.n_drones,
-                "DronesActivos": lambda m: sum(
-                    isinstance(a, DroneAgent) and not a.is_charging for a in m.schedule.agents
-                ),
-                "DronesCargando": lambda m: sum(
-                    isinstance(a, DroneAgent) and a.is_charging for a in m.schedule.agents
-                ),
+                "DronesActivos": lambda m: m.counters.count_drones_active(),
+                "DronesCargando": lambda m: m.counters.drones_charging,
 
                 # Infraestructura
                 "EstacionesCarga": lambda m: len(m.blackboard["charging_stations_positions"]),
@@ -69,33 +195,6 @@ class PalmerasModel(Model):
                 # Métricas de desempeño
                 "Cobertura": self.compute_cobertura,  # % del grid visible
                 "ObjetivosCompartidos": lambda m: len(m.blackboard["palms_targets"]),
-            },
-            agent_reporters = {
-
-                # Posición
-                "pos": lambda a: a.pos if hasattr(a, "pos") else None,
-                "x": lambda a: a.pos[0] if hasattr(a, "pos") else None,
-                "y": lambda a: a.pos[1] if hasattr(a, "pos") else None,
-
-                # Tipo de agente
-                "agent_type": lambda a: type(a).__name__,
-
-                # Estado interno general
-                "agent_state": lambda a: a.estado if isinstance(a, PalmAgent) else (
-                    a.state if isinstance(a, DroneAgent) else None
-                ),
-
-                # Estado específico de palm (solo si tiene health_level)
-                "palm_health": lambda a: a.health_level if isinstance(a, PalmAgent) and hasattr(a, "health_level") else None,
-
-                # Estado específico de drone
-                "drone_battery_level": lambda a: a.battery.get_level() if isinstance(a, DroneAgent) and hasattr(a.battery, "get_level") else None,
-                "drone_position_target": lambda a: a.target if isinstance(a, DroneAgent) else None,
-
-                # Acciones (solo para DroneAgent)
-                "drone_on_mission": lambda a: a.on_mission if isinstance(a, DroneAgent) else None,
-                "drone_is_charging": lambda a: a.is_charging if isinstance(a, DroneAgent) else None,
-                "drone_is_curing": lambda a: a.is_curing if isinstance(a, DroneAgent) else None,
             }
         )
 
@@ -104,24 +203,69 @@ class PalmerasModel(Model):
         self.width = width
         self.height = height
         self.densidad = densidad
+        self.engine = engine
+        self.palm_dynamics = palm_dynamics
+
+        # Model (World State) Parameters
+        self.counters = PopulationCounters()
+        self.camera_radius = camera_radius
+        self.world = WorldState(width, height, self.counters, pad=max(camera_radius, 1))
+        self.visibility = VisibilityTracker(self.world, radius=camera_radius)
+        self.targets_index = TargetIndex(width, height)
+        self.navigation = NavigationFields(width, height)
+        self.station_map = StationMap(width, height)
+        self.occupancy = DroneOccupancy(width, height)
+        self.reservations = None
+        if move_resolution == "reservation":
+            self.reservations = ReservationTable(width, height)
+        self.allocator = None
+        if target_allocation is not None:
+            self.allocator = TargetAllocator(target_allocation)
+        self.np_random = np.random.default_rng(random.getrandbits(32))
+
+        # Model (Computer Vision) Parameters
+        self.cv_backend = cv_backend if cv_backend is not None else RandomCVBackend(self.np_random)
+        self.batch_inference = batch_inference
+        self.inference_cache = InferenceCache(self.world) if cv_cache else None
+        self.inference_queue = InferenceQueue(self.cv_backend, self.inference_cache, self.world)
 
         # Model (Simulation) Parameters
         self.n_drones = n_drones
         self.tasa_propagacion = tasa_propagacion
         self.tasa_cura = tasa_cura
 
-        # Model (Blackboard) Parameters
-        self.blackboard = {
-            "palms_targets": {},       # Dict { (x, y): confidence }
-            "drones_positions": {},     # Dict { drone_id: (x, y) }
-            "charging_stations_positions": {}  # Dict { (x, y): is_busy }
-        }
+        # Model (Blackboard) Parameters, see Blackboard for the sections
+        self.blackboard = Blackboard()
+        self.blackboard_writes = BlackboardWriteBuffer() if buffered_blackboard else None
+        self.radio_network = RadioNetwork(radio_range) if radio_range is not None else None
 
         # Init Population of Agents in Grid
+        self.palm_agents = {}   # Dict { (x, y): PalmAgent }, agents engine only
         self._init_model_blackboard()
         self._init_model_cells_agents()
         self._init_model_drones_and_stations()
         self._init_model_palms_agents()
+        self.station_map.build(self.blackboard["charging_stations_positions"])
+
+        # Agent data (drones and palms) is recorded in typed columns
+        self.recorder = AgentRecorder(self, capacity=min(chunk_size, 1000))
+        self.result_writer = None
+        if results_dir is not None:
+            self.result_writer = ChunkedResultWriter(self, results_dir, chunk_size)
+
+        # Per-phase step timers
+        self.timers = PhaseTimers(enabled=profile)
+        self.timers.instrument(self, BLACKBOARD_MUTATORS, prefix="model.")
+        for drone in self.schedule.agents_of_type(DroneAgent):
+            self.timers.instrument(drone, DroneAgent.PHASES, prefix="drone.")
+
+        # Staged drones are stepped by the model, not the schedule
+        self.staged_drones = self.batch_inference or self.reservations is not None
+        if self.batch_inference:
+            self.timers.instrument(self.inference_queue, ("run",), prefix="inference.")
+        if self.staged_drones:
+            for drone in self.schedule.agents_of_type(DroneAgent):
+                self.schedule.deactivate(drone)
 
     def _generate_charging_positions(self):
         """
@@ -148,13 +292,13 @@ class PalmerasModel(Model):
 
 
     def _init_model_blackboard(self):
-        self.blackboard = {
-            "palms_targets": {},
-            "drones_positions": {},
-            "charging_stations_positions": {}
-        }
+        self.blackboard = Blackboard()
 
     def _init_model_cells_agents(self):
+        if self.engine == "arrays":
+            self.world.assign_cell_types(self.np_random)
+            return
+
         for x in range(self.width):
             for y in range(self.height):
                 cell_agent = GridCellAgent(self.next_id(), self, (x, y))
@@ -174,6 +318,11 @@ class PalmerasModel(Model):
 
 
     def _init_model_palms_agents(self):
+        if self.engine == "arrays":
+            blocked = [station.pos for station in self.charging_stations]
+            self.world.place_palms(self.np_random, self.densidad, blocked)
+            return
+
         for (contents, x, y) in self.grid.coord_iter():
             # Skip if already occupied by charging station or drone
             has_occupied = any(isinstance(a, (ChargingStationAgent, DroneAgent)) for a in contents)
@@ -189,7 +338,11 @@ class PalmerasModel(Model):
                 estado_inicial = "infectada" if random.random() < 0.1 else "verde"
                 palm = PalmAgent(self.next_id(), self, (x, y), estado_inicial)
                 self.grid.place_agent(palm, (x, y))
-                self.schedule.add(palm)
+                self.palm_agents[(x, y)] = palm
+
+                # Vectorized palms are updated by the model, not the schedule
+                if self.palm_dynamics == "agents":
+                    self.schedule.add(palm)
 
 
     def _init_model_drones_and_stations(self):
@@ -211,95 +364,101 @@ class PalmerasModel(Model):
             self.charging_stations.append(station)
 
             # Add to blackboard
-            self.blackboard["charging_stations_positions"][pos] = i
+            self.blackboard.set("charging_stations_positions", pos, i)
 
             # Place Drone at same position
             drone = DroneAgent(self.next_id(), self, pos)
             self.grid.place_agent(drone, pos)
+            self.occupancy.add(pos)
             self.schedule.add(drone)
 
         print(' ')
         print(' self.blackboard["charging_stations_positions"] ')
         print(' ')
-        print(self.blackboard["charging_stations_positions"])
+        print(dict(self.blackboard["charging_stations_positions"]))
         print(' ')
         print(' ')
 
 
 
     def update_blackboard_drone_positions(self, agent_id, position):
-   
-        self.blackboard["drones_positions"][agent_id] = position
-        self.reset_grid_cells()
-        self.set_grid_cells()
-
-        for y in range(self.grid.height - 1, -1, -1):
-            row = ""
-            for x in range(self.grid.width):
-                agents = self.grid.get_cell_list_contents((x, y))
-                cell_agent = next((a for a in agents if isinstance(a, GridCellAgent)), None)
-                if cell_agent:
-                    row += cell_agent.get_status_char(self.blackboard["drones_positions"]) + " "
-                else:
-                    row += "? "
-
-        visible_cells = sum(
-            1 for agent in self.schedule.agents
-            if isinstance(agent, GridCellAgent) and agent._visible_by_drones_count > 0
-        )
-        total_cells = self.grid.width * self.grid.height
-        
+        if self.blackboard_writes is not None:
+            self.blackboard_writes.add_position(agent_id, position)
+            return
 
-    def reset_grid_cells(self):
-        total_cells = self.grid.width * self.grid.height
+        self.blackboard.set("drones_positions", agent_id, position)
+        self.visibility.move(agent_id, position)
 
-        visible_before = sum(
-            1 for agent in self.schedule.agents
-            if isinstance(agent, GridCellAgent) and agent._visible_by_drones_count > 0
-        )
-        for agent in self.schedule.agents:
-            if isinstance(agent, GridCellAgent):
-                agent.reset_visibility()
+    def update_blackboard_palms_targets(self, position, confidence):
+        if self.blackboard_writes is not None:
+            self.blackboard_writes.add_detections(np.array([position[0]]), np.array([position[1]]),
+                                                  np.array([confidence]))
+            return
+        self._set_palm_target(position, confidence)
 
-        visible_after = sum(
-            1 for agent in self.schedule.agents
-            if isinstance(agent, GridCellAgent) and agent._visible_by_drones_count > 0
-        )
+    def _set_palm_target(self, position, confidence):
+        targets = self.blackboard["palms_targets"]
+        current = targets.get(position)
 
-    def set_grid_cells(self):
-        for drone_id, drone_pos in self.blackboard["drones_positions"].items():
-            x, y = drone_pos
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    nx, ny = x + dx, y + dy
-                    if 0 <= nx < self.grid.width and 0 <= ny < self.grid.height:
-                        for agent in self.grid.get_cell_list_contents((nx, ny)):
-                            if isinstance(agent, GridCellAgent):
-                                agent.mark_visible()
+        # Mark the cell only when the position first becomes a target
+        if current is None:
+            current = 0.0
+            self.world.targeted[position] = 1
+            self.targets_index.add(position)
 
-    def update_blackboard_palms_targets(self, position, confidence):
-        current = self.blackboard["palms_targets"].get(position, 0.0)
-        self.blackboard["palms_targets"][position] = 0.5*current + 0.5*confidence
+        self.blackboard.set("palms_targets", position, 0.5*current + 0.5*confidence)
 
-        for agent in self.schedule.agents:
-            if isinstance(agent, GridCellAgent):
-                agent.reset_target()
-
-        for pos in self.blackboard["palms_targets"]:
-            print(f"[DEBUG] Marking cell {pos} as palm target")
-            for agent in self.grid.get_cell_list_contents(pos):
-                if isinstance(agent, GridCellAgent):
-                    agent.mark_as_target()
+    def update_blackboard_detections(self, xs, ys, confidences):
+        """
+        Publish the detections of one photo, given as arrays: cells seen
+        infected (confidence > 0) become targets, targets seen healthy
+        with enough confidence (< -0.5) are removed.
+        """
+        if self.blackboard_writes is not None:
+            self.blackboard_writes.add_detections(xs, ys, confidences)
+            return
+        self._apply_detections(xs, ys, confidences)
+
+    def _apply_detections(self, xs, ys, confidences):
+        infected = confidences > 0
+        if infected.any():
+            for x, y, confidence in zip(xs[infected].tolist(), ys[infected].tolist(),
+                                        confidences[infected].tolist()):
+                self._set_palm_target((x, y), confidence)
+
+        # Only cells marked as targets can be removed from the blackboard
+        cured = (confidences < -0.5) & (self.world.targeted[xs, ys] > 0)
+        if cured.any():
+            for x, y, confidence in zip(xs[cured].tolist(), ys[cured].tolist(), confidences[cured].tolist()):
+                self._remove_palm_target((x, y), confidence)
 
     def get_blackboard_palms_targets(self):
-        raw_targets = self.blackboard.get("palms_targets", {})
-        return [{"location": pos, "confidence": conf} for pos, conf in raw_targets.items()]
+        """Immutable targets snapshot, rebuilt only after the targets change."""
+        return self.blackboard.snapshot("palms_targets", _targets_snapshot)
+
+    def get_blackboard_targets_index(self):
+        return self.targets_index
     
+    def get_blackboard_targets_assignments(self):
+        """{drone_id: (x, y)} of this tick, or None if the drones choose their own targets."""
+        if self.allocator is None:
+            return None
+        return self.blackboard["targets_assignments"]
+
     def get_blackboard_charging_stations_positions(self):
-        return self.blackboard["charging_stations_positions"]
+        return self.blackboard.snapshot("charging_stations_positions")
+
+    def get_nearest_charging_station(self, position):
+        """(station_pos, distance) from the precomputed station map."""
+        return self.station_map.nearest(position)
+
+    def get_drones_occupancy(self):
+        """DroneOccupancy of the current drone positions (updated on every move)."""
+        return self.occupancy
 
     def get_blackboard_drones_positions(self):
-        return self.blackboard.get("drones_positions", {})
+        """Read-only live view: positions published earlier in the tick are visible."""
+        return self.blackboard["drones_positions"]
     
     def report_palm_cured(self, position, confidence=0):
         """
@@ -307,32 +466,150 @@ class PalmerasModel(Model):
         position has been cured. If confidence is high enough, removes
         the target from the blackboard and updates GridCellAgent visuals.
         """
+        if self.blackboard_writes is not None:
+            self.blackboard_writes.add_cured(position, confidence)
+            return
+        self._remove_palm_target(position, confidence)
 
+    def _remove_palm_target(self, position, confidence):
         if position in self.blackboard["palms_targets"]:
             if abs(confidence) > 0.5:
-                del self.blackboard["palms_targets"][position]
+                self.blackboard.delete("palms_targets", position)
+
+                self.targets_index.remove(position)
+
+                # Update GridCellAgent visuals
+                self.world.targeted[position] = 0
+
+    def commit_blackboard_writes(self):
+        """
+        Merge the writes buffered during the tick into the blackboard:
+        the last position of every drone, then every detection (targets
+        added in write order, then removals), then the cure reports.
+        """
+        positions, xs, ys, confidences, cured = self.blackboard_writes.drain()
+
+        for agent_id, position in positions.items():
+            self.blackboard.set("drones_positions", agent_id, position)
+            self.visibility.move(agent_id, position)
+
+        if len(confidences):
+            self._apply_detections(xs, ys, confidences)
 
-        # Update GridCellAgent visuals
-        for agent in self.grid.get_cell_list_contents([position]):
-            if isinstance(agent, GridCellAgent):
-                agent.reset_target()
+        for position, confidence in cured:
+            self._remove_palm_target(position, confidence)
 
+    def allocate_targets(self):
+        """
+        Assign the blackboard targets to the drones that can take one,
+        in one batched computation for the whole fleet.
+        """
+        previous = self.blackboard["targets_assignments"]
+        assignments = {}
+        drones_positions = {}
+        for drone in self.schedule.agents_of_type(DroneAgent):
+            if not drone.can_take_target():
+                continue
 
+            # A drone keeps its target until the target leaves the blackboard
+            target = previous.get(drone.unique_id)
+            if target is not None and target in self.targets_index:
+                assignments[drone.unique_id] = target
+            else:
+                drones_positions[drone.unique_id] = drone.pos
+
+        taken = set(assignments.values())
+        targets = [pos for pos in self.targets_index if pos not in taken]
+        assignments.update(self.allocator.allocate(drones_positions, targets))
+        self.blackboard.replace("targets_assignments", assignments)
 
     def step(self):
         self.datacollector.collect(self)
+        self.recorder.collect()
+        if self.result_writer is not None:
+            self.result_writer.maybe_flush()
+
+        if self.allocator is not None:
+            self.allocate_targets()
+
+        if self.staged_drones:
+            self.step_drones_staged()
+
         self.schedule.step()
 
+        if self.palm_dynamics == "vectorized":
+            self.world.step_palms(self.tasa_propagacion, self.np_random)
+
+        if self.blackboard_writes is not None:
+            self.commit_blackboard_writes()
+
+        self.timers.end_tick()
+
+
+    def step_drones_staged(self):
+        """
+        Step every drone in stages: communication and sensing for all
+        drones (around one batched CV inference with batch_inference),
+        then control and action for all drones, the resolution of their
+        moves (with a reservation table), and output communication.
+        """
+        drones = self.schedule.agents_of_type(DroneAgent)
+        if self.event_activation:
+            self.schedule.wake_due()
+            drones = [drone for drone in drones if not self.schedule.is_asleep(drone)]
+        self.random.shuffle(drones)
+
+        for drone in drones:
+            drone.do_input_communication()
+            if self.batch_inference:
+                drone.capture()
+                self.inference_queue.submit(drone.photo, drone.receive_vision, drone.pos)
+            else:
+                drone.do_sensing()
+
+        if self.batch_inference:
+            self.inference_queue.run()
+
+        if self.reservations is None:
+            for drone in drones:
+                drone.do_control()
+                drone.do_action()
+                drone.do_output_communication()
+            return
+
+        for drone in drones:
+            drone.do_control()
+            drone.do_action()
+        self.resolve_moves()
+        for drone in drones:
+            drone.do_output_communication()
+
+    def resolve_moves(self):
+        """Resolve the moves proposed this tick and apply them all through Rotors."""
+        for drone, next_pos in self.reservations.resolve(self.occupancy).items():
+            drone.rotors.apply(drone, next_pos)
+
+    def close_results(self):
+        """Flush the pending rows of a streamed run and mark it complete."""
+        if self.result_writer is not None:
+            self.result_writer.close()
+
+            if self.timers.enabled:
+                self.timers.save_csv(os.path.join(self.result_writer.directory, "timers.csv"))
 
     def count_palmas_infectadas(self):
-        return sum(1 for a in self.schedule.agents if isinstance(a, PalmAgent) and a.estado == "infectada")
+        return self.world.count_state("infectada")
 
     def count_palmas_curadas(self):
-        return sum(1 for a in self.schedule.agents if isinstance(a, PalmAgent) and a.estado == "verde")
+        return self.world.count_state("verde")
 
     def compute_cobertura(self):
-        total = self.grid.width * self.grid.height
-        visibles = sum(1 for a in self.schedule.agents if isinstance(a, GridCellAgent) and a.IsVisibleByDrones)
-        return visibles / total if total > 0 else 0
+        return self.visibility.coverage()
+
 
-    
\ No newline at end of file
+def _targets_snapshot(targets):
+    """palms_targets as a tuple of read-only {"location", "confidence"} dicts."""
+    return tuple(
+        MappingProxyType({"location": pos, "confidence": conf})
+        for pos, conf in targets.items()
+    )
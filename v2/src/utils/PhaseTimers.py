@@ -0,0 +1,103 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import time
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Utils : PhaseTimers.py ------------------------------ #
+# --------------------------------------------------------- #
+# Description:
+# Low-overhead timers for the phases of a simulation tick.
+# Methods are timed by replacing them on the *instance* with a
+# timing wrapper, and only when the timers are enabled: with
+# timers disabled nothing is wrapped and the cost is zero.
+#
+# The time spent in each phase is summed per tick; end_tick()
+# closes the tick so every phase gets one sample per tick.
+#
+# Methods:
+# - instrument(obj, method_names, prefix): time methods of obj
+# - end_tick(): close the current tick
+# - totals(), histogram(phase), to_dataframe(), save_csv(path)
+# --------------------------------------------------------- #
+
+
+class PhaseTimers:
+    """
+    PhaseTimers aggregates wall time per phase and per tick.
+
+    Parameters:
+    - enabled (bool): if False, instrument() and end_tick() do nothing
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.phases = []                      # phase names in first-seen order
+        self._current = defaultdict(float)    # {phase: seconds} for the open tick
+        self._calls = defaultdict(int)        # {phase: calls} for the open tick
+        self._ticks = []                      # list of ({phase: s}, {phase: calls})
+
+    def instrument(self, obj, method_names, prefix=""):
+        """Replace obj.<name>() by a timed version for every name given."""
+        if not self.enabled:
+            return
+
+        for name in method_names:
+            phase = prefix + name
+            if phase not in self.phases:
+                self.phases.append(phase)
+            setattr(obj, name, self._timed(phase, getattr(obj, name)))
+
+    def _timed(self, phase, method):
+        current, calls = self._current, self._calls
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                current[phase] += clock() - start
+                calls[phase] += 1
+        return timed
+
+    def end_tick(self):
+        if not self.enabled:
+            return
+        self._ticks.append((dict(self._current), dict(self._calls)))
+        self._current.clear()
+        self._calls.clear()
+
+    # --- Reading ---
+    def per_tick(self, phase):
+        """Array with the seconds spent in phase for every closed tick."""
+        return np.array([seconds.get(phase, 0.0) for seconds, _ in self._ticks])
+
+    def totals(self):
+        """{phase: total seconds} over every closed tick."""
+        return {phase: float(self.per_tick(phase).sum()) for phase in self.phases}
+
+    def histogram(self, phase, bins=20):
+        """np.histogram of the per-tick seconds of a phase."""
+        return np.histogram(self.per_tick(phase), bins=bins)
+
+    def to_dataframe(self):
+        """One row per tick, with '<phase>' seconds and '<phase>_calls' columns."""
+        rows = []
+        for seconds, calls in self._ticks:
+            row = {}
+            for phase in self.phases:
+                row[phase] = seconds.get(phase, 0.0)
+                row[f"{phase}_calls"] = calls.get(phase, 0)
+            rows.append(row)
+        df = pd.DataFrame(rows, columns=[c for p in self.phases for c in (p, f"{p}_calls")])
+        df.index.name = "Step"
+        return df
+
+    def save_csv(self, path):
+        self.to_dataframe().to_csv(path)
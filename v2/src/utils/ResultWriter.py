@@ -0,0 +1,185 @@
+# --------------------------------------------------------- #
+# --- Imports --------------------------------------------- #
+# --------------------------------------------------------- #
+import os
+import json
+import glob
+import numpy as np
+import pandas as pd
+
+from src.models.AgentRecorder import build_agent_dataframe
+# --------------------------------------------------------- #
+
+# --------------------------------------------------------- #
+# --- Utils : ResultWriter.py ----------------------------- #
+# --------------------------------------------------------- #
+# Description:
+# Streaming sink for long runs. Model reporter rows and the
+# AgentRecorder columns are flushed every `chunk_size` steps to
+# numbered, append-only .npz chunk files, and then dropped from
+# memory, so memory stays flat over the run length. Each chunk
+# is written to a temporary file and renamed, so an interrupted
+# run keeps every chunk flushed before the interruption.
+#
+# Layout of `directory`:
+# - static.npz: static agents, palm ids/positions, drone ids
+# - chunk_000000.npz, chunk_000001.npz, ...: one per flush
+# - done.json: written by close()
+#
+# Functions:
+# - read_results(directory): (model_df, agents_df) in memory
+# - iter_results(directory): the same, one chunk at a time
+# - export_csv(directory, model_csv, agents_csv): chunked CSV
+# --------------------------------------------------------- #
+
+
+class ChunkedResultWriter:
+    """
+    ChunkedResultWriter flushes a model's collected data to disk in
+    fixed-size chunks during the run.
+
+    After a flush the DataCollector model_vars and the AgentRecorder
+    rows are cleared, so the in-memory DataFrames only contain the rows
+    not flushed yet; use read_results() to load the whole run.
+
+    Parameters:
+    - model: the PalmerasModel whose data is written
+    - directory (str): output folder, created if needed
+    - chunk_size (int): number of recorded steps per chunk
+    """
+
+    def __init__(self, model, directory, chunk_size=1000):
+        self.model = model
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.n_chunks = 0
+
+        # A new run replaces any previous run written to the same folder
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "chunk_*.npz")) + [os.path.join(directory, "done.json")]:
+            if os.path.exists(path):
+                os.remove(path)
+        self._write_static()
+
+    def _write_static(self):
+        recorder = self.model.recorder
+        static = recorder.static_record()
+        self._save("static.npz", {
+            "ids": np.asarray(static["ids"], dtype=np.int64),
+            "x": np.asarray(static["x"], dtype=np.int16),
+            "y": np.asarray(static["y"], dtype=np.int16),
+            "types": np.asarray(static["types"], dtype=str),
+            "drone_ids": recorder.drone_ids,
+            "palm_ids": recorder.palm_ids,
+            "palm_x": recorder.palm_x,
+            "palm_y": recorder.palm_y,
+        })
+
+    def maybe_flush(self):
+        """Flush if a full chunk has been recorded."""
+        if self.model.recorder.n_steps >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write every pending row to a new chunk file and clear it from memory."""
+        recorder = self.model.recorder
+        if recorder.n_steps == 0:
+            return
+
+        model_vars = self.model.datacollector.model_vars
+        arrays = {f"model.{name}": np.asarray(values) for name, values in model_vars.items()}
+        for values in model_vars.values():
+            values.clear()
+
+        record = recorder.drain()
+        arrays["steps"] = record["steps"]
+        arrays["drone_state_names"] = np.asarray(record["drone_state_names"], dtype=str)
+        arrays.update({f"drones.{name}": values for name, values in record["drones"].items()})
+        arrays.update({f"palms.{name}": values for name, values in record["palms"].items()})
+
+        self._save(f"chunk_{self.n_chunks:06d}.npz", arrays)
+        self.n_chunks += 1
+
+    def close(self):
+        """Flush the remaining rows and mark the run as complete."""
+        self.flush()
+        with open(os.path.join(self.directory, "done.json"), "w") as f:
+            json.dump({"chunks": self.n_chunks}, f)
+
+    def _save(self, filename, arrays):
+        path = os.path.join(self.directory, filename)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+
+# --------------------------------------------------------- #
+# --- Readers --------------------------------------------- #
+# --------------------------------------------------------- #
+
+def iter_results(directory):
+    """Yield (model_df, agents_df) for every chunk, in order."""
+    with np.load(os.path.join(directory, "static.npz")) as static_file:
+        static = {name: static_file[name] for name in static_file.files}
+
+    chunk_paths = sorted(glob.glob(os.path.join(directory, "chunk_*.npz")))
+    for i, path in enumerate(chunk_paths):
+        with np.load(path) as chunk:
+            model_df = pd.DataFrame({
+                name[len("model."):]: chunk[name]
+                for name in chunk.files if name.startswith("model.")
+            })
+            record = {
+                "steps": chunk["steps"],
+                "drone_ids": static["drone_ids"],
+                "drone_state_names": chunk["drone_state_names"].tolist(),
+                "drones": {
+                    name[len("drones."):]: chunk[name]
+                    for name in chunk.files if name.startswith("drones.")
+                },
+                "palm_ids": static["palm_ids"],
+                "palm_x": static["palm_x"],
+                "palm_y": static["palm_y"],
+                "palms": {
+                    name[len("palms."):]: chunk[name]
+                    for name in chunk.files if name.startswith("palms.")
+                },
+            }
+
+        # Static agents are logged once, with the first chunk
+        static_record = None
+        if i == 0 and len(record["steps"]):
+            static_record = {
+                "step": int(record["steps"][0]),
+                "ids": static["ids"].tolist(),
+                "x": static["x"].tolist(),
+                "y": static["y"].tolist(),
+                "types": static["types"].tolist(),
+            }
+
+        yield model_df, build_agent_dataframe(record, static_record)
+
+
+def read_results(directory):
+    """Load a whole streamed run as (model_df, agents_df)."""
+    model_dfs, agent_dfs = [], []
+    for model_df, agents_df in iter_results(directory):
+        model_dfs.append(model_df)
+        agent_dfs.append(agents_df)
+
+    if not model_dfs:
+        return pd.DataFrame(), build_agent_dataframe({"steps": [], "drone_ids": [], "palm_ids": []})
+    return pd.concat(model_dfs, ignore_index=True), pd.concat(agent_dfs)
+
+
+def export_csv(directory, model_csv, agents_csv):
+    """Convert a streamed run to CSV files one chunk at a time."""
+    offset = 0
+    for i, (model_df, agents_df) in enumerate(iter_results(directory)):
+        model_df.index += offset
+        offset += len(model_df)
+
+        mode, header = ("w", True) if i == 0 else ("a", False)
+        model_df.to_csv(model_csv, mode=mode, header=header, index=True)
+        agents_df.to_csv(agents_csv, mode=mode, header=header, index=True)
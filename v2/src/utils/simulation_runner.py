@@ -0,0 +1,113 @@
+import os
+import contextlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from src.models.model import PalmerasModel
+
+
+def run_simulation(params: dict, seed=None):
+    """
+    Run one simulation and return its model variables DataFrame.
+    `height` defaults to `width` (square grid) when not given.
+    """
+    model = PalmerasModel(
+        width=params["width"],
+        height=params.get("height", params["width"]),
+        densidad=params["densidad"],
+        n_drones=params["n_drones"],
+        tasa_propagacion=params["tasa_propagacion"],
+        tasa_cura=params["tasa_cura"],
+        engine=params.get("engine", "agents"),
+        target_allocation=params.get("target_allocation"),
+        seed=seed
+    )
+    for _ in range(params["max_steps"]):
+        model.step()
+    return model.datacollector.get_model_vars_dataframe()
+
+
+def safe_div(n, d):
+    return n / d if d > 0 else 0
+
+
+def compute_score(row):
+    palmas_totales = row["PalmasTotales"]
+    infectadas = row["PalmasInfectadas"]
+    cured_rate = safe_div(row["PalmasSanas"], palmas_totales)
+    burned_rate = safe_div(row["PalmasQuemadas"], palmas_totales)
+    detection_rate = safe_div(row["PalmasDetectadas"], infectadas)
+    return 0.4 * cured_rate + 0.3 * (1 - burned_rate) + 0.3 * detection_rate
+
+
+# --------------------------------------------------------- #
+# --- Parameter sweeps ------------------------------------ #
+# --------------------------------------------------------- #
+
+def expand_grid(base_params: dict, grid: dict, n_runs: int, seed=0):
+    """
+    Expand a parameter grid into a list of jobs, one per combination
+    and replication, each with its own explicit seed.
+
+    Parameters:
+    - base_params (dict): values shared by every run
+    - grid (dict): {param_name: [values...]}, combined as a product
+    - n_runs (int): replications per combination
+    - seed (int): root seed the per-run seeds are derived from
+
+    Returns:
+    - list of dicts: {"run", "params", "seed"}
+    """
+    names = list(grid)
+    combinations = list(itertools.product(*(grid[name] for name in names)))
+    seeds = np.random.SeedSequence(seed).generate_state(len(combinations) * n_runs)
+
+    jobs = []
+    for i, values in enumerate(combinations):
+        for run in range(n_runs):
+            params = dict(base_params, **dict(zip(names, values)))
+            jobs.append({
+                "run": run + 1,
+                "params": params,
+                "seed": int(seeds[i * n_runs + run]),
+            })
+    return jobs
+
+
+def run_job(job: dict):
+    """Worker entry point: run one job and return its result row."""
+    params = job["params"]
+
+    # Per-step prints from the agents are not useful across processes
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        df = run_simulation(params, seed=job["seed"])
+
+    df["PerformanceScore"] = df.apply(compute_score, axis=1)
+    final = df.iloc[-1]
+
+    row = {"run": job["run"], "seed": job["seed"]}
+    row.update(params)
+    row["final_score"] = final["PerformanceScore"]
+    row.update({f"final_{name}": final[name] for name in df.columns if name != "PerformanceScore"})
+    return row
+
+
+def run_sweep(base_params: dict, grid: dict, n_runs: int, seed=0, max_workers=None):
+    """
+    Run every job of the parameter grid on a process pool and merge
+    the per-run scores into one DataFrame, sorted by parameters and run.
+    """
+    jobs = expand_grid(base_params, grid, n_runs, seed)
+    rows = []
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        futures = [pool.submit(run_job, job) for job in jobs]
+        for done, future in enumerate(as_completed(futures), start=1):
+            rows.append(future.result())
+            print(f"[{done}/{len(jobs)}] runs completed")
+
+    results = pd.DataFrame(rows)
+    return results.sort_values(list(grid) + ["run"]).reset_index(drop=True)
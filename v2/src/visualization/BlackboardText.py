@@ -16,12 +16,8 @@ class BlackboardText(TextElement):
         target_rows = ""
         for i, (pos, confidence) in enumerate(targets.items()):
             # Try to get state and health
-            estado, health = "?", None
-            for agent in model.grid.get_cell_list_contents([pos]):
-                if hasattr(agent, "estado"):
-                    estado = agent.estado
-                    health = getattr(agent, "health_level", None)
-                    break
+            estado = model.world.get_palm_state(pos) or "?"
+            health = model.world.get_palm_health(pos)
             health_str = f"{health:.0f}%" if health is not None else "?"
             target_rows += f"<tr><td>{i+1}</td><td>{pos}</td><td>{confidence:.2f}</td><td>{estado}</td><td>{health_str}</td></tr>"
 
@@ -10,10 +10,10 @@ class GridCellAgent(Agent):
 
         # --- Type assignment ---
         self._type = self._assign_type()
+        self.model.world.cell_type[pos] = self._type
 
-        # --- Drone tracking ---
-        self._visible_by_drones_count = 0
-        self._targeted_palm_by_drones_count = 0
+        # --- Drone tracking (stored in model.world arrays) ---
+        self._world = self.model.world
 
     def _assign_type(self):
         if random.random() < 0.95:
@@ -32,6 +32,14 @@ class GridCellAgent(Agent):
     def can_have_palm(self):
         return self._type == 0
 
+    @property
+    def _visible_by_drones_count(self):
+        return int(self._world.visible[self._initial_pos])
+
+    @property
+    def _targeted_palm_by_drones_count(self):
+        return int(self._world.targeted[self._initial_pos])
+
     @property
     def IsVisibleByDrones(self):
         return self._visible_by_drones_count > 0
@@ -42,22 +50,22 @@ class GridCellAgent(Agent):
 
     # --- Methods to modify visibility and target counters ---
     def mark_visible(self):
-        self._visible_by_drones_count += 1
+        self._world.visible[self._initial_pos] += 1
 
     def unmark_visible(self):
-        self._visible_by_drones_count = max(0, self._visible_by_drones_count - 1)
+        self._world.visible[self._initial_pos] = max(0, self._visible_by_drones_count - 1)
 
     def reset_visibility(self):
-        self._visible_by_drones_count = 0
+        self._world.visible[self._initial_pos] = 0
 
     def mark_as_target(self):
-        self._targeted_palm_by_drones_count += 1
+        self._world.targeted[self._initial_pos] += 1
 
     def unmark_as_target(self):
-        self._targeted_palm_by_drones_count = max(0, self._targeted_palm_by_drones_count - 1)
+        self._world.targeted[self._initial_pos] = max(0, self._targeted_palm_by_drones_count - 1)
 
     def reset_target(self):
-        self._targeted_palm_by_drones_count = 0
+        self._world.targeted[self._initial_pos] = 0
 
     # --- Debug and Visualization Helpers ---
     def get_status_char(self, drone_positions):